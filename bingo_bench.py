@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Benchmarks for card generation, card rendering and full PDF output."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import itertools
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import bingo_generator
+from bingo_generator import Config, generate_pdf, load_numpy
+
+np = load_numpy()
+
+BENCH_FORMAT_VERSION = 1
+PROFILES: Dict[str, Dict[str, List]] = {
+    "quick": {
+        "sheets": [100, 1000],
+        "sheets_per_page": [1, 4, 12],
+        "distribution": ["segmented", "fully-random"],
+        "paper_size": ["a4", "letter"],
+    },
+    "full": {
+        "sheets": [100, 1000, 10000, 100000],
+        "sheets_per_page": [1, 4, 12],
+        "distribution": ["segmented", "fully-random"],
+        "paper_size": ["a4", "letter"],
+    },
+}
+# Card counts for the generation and rendering micro-benchmarks.
+GENERATE_CARDS = 100000
+DRAW_CARDS = 2000
+# Cards drawn one at a time, as unique and --max-shared redraws are, for the single-card benchmark.
+SINGLE_CARDS = 10000
+# Cards per distribution and sampling path checked by --check-uniformity.
+UNIFORMITY_CARDS = 200000
+# Chi-square z-score beyond which --check-uniformity reports a distribution as skewed.
+UNIFORMITY_Z = 5.0
+
+
+@dataclass
+class BenchResult:
+    name: str
+    seconds: float
+    items: int
+    per_second: float
+
+
+@dataclass
+class UniformityResult:
+    name: str
+    chi_square: float
+    degrees: int
+    z: float
+    passed: bool
+
+
+def _config(output: str, sheets: int, sheets_per_page: int, distribution: str, paper_size: str) -> Config:
+    return Config(
+        output=output,
+        sheets=sheets,
+        sheets_per_page=sheets_per_page,
+        paper_size=paper_size,
+        min_number=1,
+        max_number=75,
+        distribution=distribution,
+        letter_color_mode="black",
+        custom_letter_colors=None,
+        free_center=True,
+        free_center_text="FREE",
+        seed=1,
+        assume_yes=True,
+    )
+
+
+def _measure(name: str, items: int, repeat: int, run: Callable[[], None]) -> BenchResult:
+    """Time ``run`` ``repeat`` times and keep the fastest, least noisy, run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return BenchResult(name=name, seconds=best, items=items, per_second=items / best if best > 0 else 0.0)
+
+
+def bench_generate(distribution: str, repeat: int) -> BenchResult:
+    config = _config("", GENERATE_CARDS, 4, distribution, "a4")
+    segments = bingo_generator.validate_config(config)
+    cards = bingo_generator._card_sequence(config, segments, seed=1)
+    return _measure(
+        f"generate/{distribution}/{GENERATE_CARDS}",
+        GENERATE_CARDS,
+        repeat,
+        lambda: cards.batch(0, GENERATE_CARDS),
+    )
+
+
+def bench_sample(distribution: str, single: bool, repeat: int) -> BenchResult:
+    """Time the card sampler alone, without deriving the random words, per batch or one card at a time."""
+    count = SINGLE_CARDS if single else GENERATE_CARDS
+    config = _config("", count, 4, distribution, "a4")
+    segments = bingo_generator.validate_config(config)
+    cards = bingo_generator._card_sequence(config, segments, seed=1)
+    words = [cards._words(index, 0) for index in range(count)]
+    if single:
+
+        def run() -> None:
+            for card_words in words:
+                cards.sampler.cards(card_words, 1)
+
+    else:
+        raw_words = b"".join(words)
+
+        def run() -> None:
+            cards.sampler.cards(raw_words, count)
+
+    kind = "sample-single" if single else "sample"
+    return _measure(f"{kind}/{distribution}/{count}", count, repeat, run)
+
+
+def bench_draw(sheets_per_page: int, repeat: int) -> BenchResult:
+    config = _config("", DRAW_CARDS, sheets_per_page, "segmented", "a4")
+    segments = bingo_generator.validate_config(config)
+    batch = bingo_generator._card_sequence(config, segments, seed=1).batch(0, DRAW_CARDS)
+    bingo_generator._require_reportlab()
+    letter_colors = {letter: bingo_generator.colors.black for letter in bingo_generator.LETTERS}
+
+    def run() -> None:
+        pdf = bingo_generator.canvas.Canvas(io.BytesIO(), pagesize=bingo_generator.A4)
+        bingo_generator._render_cards(pdf, config, letter_colors, [batch])
+
+    return _measure(f"draw/{sheets_per_page}/{DRAW_CARDS}", DRAW_CARDS, repeat, run)
+
+
+def bench_pdf(
+    sheets: int,
+    sheets_per_page: int,
+    distribution: str,
+    paper_size: str,
+    stream: bool,
+    repeat: int,
+    work_dir: str,
+) -> BenchResult:
+    kind = "pdf-stream" if stream else "pdf"
+    output = os.path.join(work_dir, "bench.pdf")
+    config = _config(output, sheets, sheets_per_page, distribution, paper_size)
+    config.stream = stream
+    return _measure(
+        f"{kind}/{distribution}/{paper_size}/{sheets_per_page}/{sheets}",
+        sheets,
+        repeat,
+        lambda: generate_pdf(config, warning_handler=lambda _message: True),
+    )
+
+
+def run_benchmarks(profile: str, repeat: int, progress: Optional[Callable[[BenchResult], None]] = None) -> List[BenchResult]:
+    matrix = PROFILES[profile]
+    results: List[BenchResult] = []
+
+    def record(result: BenchResult) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    for distribution in matrix["distribution"]:
+        record(bench_generate(distribution, repeat))
+        for single in (False, True):
+            record(bench_sample(distribution, single, repeat))
+    for sheets_per_page in matrix["sheets_per_page"]:
+        record(bench_draw(sheets_per_page, repeat))
+
+    with tempfile.TemporaryDirectory(prefix="bingo-bench-") as work_dir:
+        for sheets, sheets_per_page, distribution, paper_size in itertools.product(
+            matrix["sheets"], matrix["sheets_per_page"], matrix["distribution"], matrix["paper_size"]
+        ):
+            # Large runs are dominated by rendering; time them once.
+            runs = 1 if sheets >= 10000 else repeat
+            for stream in (False, True):
+                record(bench_pdf(sheets, sheets_per_page, distribution, paper_size, stream, runs, work_dir))
+    return results
+
+
+def _pearson(observed: Counter, expected: Dict[object, float], variance_scale: float = 1.0) -> float:
+    """Pearson's statistic for counts whose variance is ``variance_scale`` times their expectation."""
+    return sum((observed.get(key, 0) - want) ** 2 / (want * variance_scale) for key, want in expected.items())
+
+
+def _uniformity(name: str, chi_square: float, degrees: int) -> UniformityResult:
+    # Wilson-Hilferty: the cube root of chi-square / df is close to normal.
+    scale = 2.0 / (9.0 * degrees)
+    z = ((chi_square / degrees) ** (1.0 / 3.0) - (1.0 - scale)) / math.sqrt(scale)
+    return UniformityResult(name=name, chi_square=chi_square, degrees=degrees, z=z, passed=abs(z) <= UNIFORMITY_Z)
+
+
+def _draw_scale(picks: int, pool: int) -> float:
+    # A card holds a number at most once, so each count is a sum of Bernoulli(picks / pool)
+    # draws whose negative covariance within the pool makes chi-square on pool - 1 df.
+    return (1.0 - picks / pool) * pool / (pool - 1)
+
+
+def check_uniformity(distribution: str, single: bool, count: int = UNIFORMITY_CARDS) -> List[UniformityResult]:
+    """Chi-square checks that sampled cards are uniform: every number equally likely within its
+    column or range, every segmented column an equally likely subset, and, for fully random
+    cards, every number equally likely in every cell."""
+    config = _config("", count, 4, distribution, "a4")
+    segments = bingo_generator.validate_config(config)
+    cards = bingo_generator._card_sequence(config, segments, seed=1)
+    if single:
+        rows = [cards.variant(index, 0).card_offsets(0) for index in range(count)]
+    else:
+        batch = cards.batch(0, count)
+        rows = [batch.card_offsets(index) for index in range(count)]
+    if np is not None:
+        rows = [np.ravel(row).tolist() for row in rows]
+    prefix = f"uniformity/{distribution}/{'single' if single else 'batch'}"
+    span = config.max_number - config.min_number + 1
+    numbers = Counter(offset for row in rows for offset in row if offset)
+    results = []
+
+    if distribution == "segmented":
+        # Columns are drawn independently, so their statistics add up.
+        chi_square = 0.0
+        degrees = 0
+        for col, bucket in enumerate(segments):
+            cells = [row * 5 + col for row in range(5) if not (col == 2 and row == 2)]
+            first = bucket[0] - config.min_number + 1
+            offsets = range(first, first + len(bucket))
+            expected: Dict[object, float] = {offset: count * len(cells) / len(bucket) for offset in offsets}
+            chi_square += _pearson(numbers, expected, _draw_scale(len(cells), len(bucket)))
+            degrees += len(bucket) - 1
+        results.append(_uniformity(f"{prefix}/numbers", chi_square, degrees))
+        for col, bucket in enumerate(segments):
+            cells = [row * 5 + col for row in range(5) if not (col == 2 and row == 2)]
+            first = bucket[0] - config.min_number + 1
+            subsets = Counter(tuple(card[cell] for cell in cells) for card in rows)
+            possible = list(itertools.combinations(range(first, first + len(bucket)), len(cells)))
+            expected = {subset: count / len(possible) for subset in possible}
+            letter = bingo_generator.LETTERS[col]
+            results.append(_uniformity(f"{prefix}/column-{letter}", _pearson(subsets, expected), len(possible) - 1))
+    else:
+        expected = {offset: count * 24 / span for offset in range(1, span + 1)}
+        results.append(_uniformity(f"{prefix}/numbers", _pearson(numbers, expected, _draw_scale(24, span)), span - 1))
+        placed = Counter((cell, offset) for row in rows for cell, offset in enumerate(row) if offset)
+        expected = {(cell, offset): count / span for cell in range(25) if cell != 12 for offset in range(1, span + 1)}
+        results.append(_uniformity(f"{prefix}/cells", _pearson(placed, expected), 24 * (span - 1)))
+    return results
+
+
+def load_baseline(path: str) -> Dict:
+    """Read a results file written by an earlier run, raising ValueError if it is unreadable or malformed."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    except OSError as err:
+        raise ValueError(f"Cannot read baseline '{path}': {err.strerror}") from err
+    except ValueError as err:
+        raise ValueError(f"Baseline '{path}' is not valid JSON: {err}") from err
+    entries = baseline.get("results") if isinstance(baseline, dict) else None
+    if not isinstance(entries, list) or not all(
+        isinstance(entry, dict) and isinstance(entry.get("name"), str) and isinstance(entry.get("seconds"), (int, float))
+        for entry in entries
+    ):
+        raise ValueError(f"Baseline '{path}' is not a benchmark results file")
+    return baseline
+
+
+def compare(results: Sequence[BenchResult], baseline: Dict, tolerance: float) -> List[str]:
+    """Return a message for every benchmark slower than the baseline beyond ``tolerance``."""
+    previous = {entry["name"]: entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get(result.name)
+        if old is None or old["seconds"] <= 0:
+            continue
+        ratio = result.seconds / old["seconds"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                f"{result.name}: {result.seconds:.4f}s vs baseline {old['seconds']:.4f}s ({(ratio - 1.0) * 100:.1f}% slower)"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark bingo card generation and PDF output.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="Benchmark matrix (default: quick)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest is kept (default: 3)")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="Compare against a results file from an earlier run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown against the baseline before flagging it (default: 0.10 = 10%%)",
+    )
+    parser.add_argument(
+        "--check-uniformity",
+        action="store_true",
+        help="Instead of timing, chi-square test that sampled cards are uniformly distributed",
+    )
+    args = parser.parse_args(argv)
+    if args.repeat <= 0:
+        print("Error: --repeat must be greater than 0", file=sys.stderr)
+        return 2
+    baseline: Optional[Dict] = None
+    if args.baseline:
+        # Read before benchmarking, so a bad path fails in seconds rather than after the run.
+        try:
+            baseline = load_baseline(args.baseline)
+        except ValueError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            return 2
+
+    if args.check_uniformity:
+        checks: List[UniformityResult] = []
+        for distribution in PROFILES[args.profile]["distribution"]:
+            for single in (False, True):
+                for check in check_uniformity(distribution, single):
+                    checks.append(check)
+                    verdict = "ok" if check.passed else "SKEWED"
+                    print(
+                        f"{check.name}: chi-square {check.chi_square:.1f} on {check.degrees} df, "
+                        f"z {check.z:+.2f} {verdict}",
+                        file=sys.stderr,
+                    )
+        payload = json.dumps({"version": BENCH_FORMAT_VERSION, "uniformity": [asdict(check) for check in checks]}, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as handle:
+                handle.write(payload + "\n")
+        else:
+            print(payload)
+        return 0 if all(check.passed for check in checks) else 1
+
+    def progress(result: BenchResult) -> None:
+        print(f"{result.name}: {result.seconds:.4f}s ({result.per_second:,.0f}/s)", file=sys.stderr)
+
+    results = run_benchmarks(args.profile, args.repeat, progress)
+    report = {
+        "version": BENCH_FORMAT_VERSION,
+        "profile": args.profile,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np is not None,
+        "results": [asdict(result) for result in results],
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"SLOWER: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No slowdowns against baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -6,25 +6,73 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import contextvars
+import functools
+import hashlib
+import importlib.util
+import json
 import math
+import os
 import random
 import re
+import shutil
+import struct
 import sys
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import tempfile
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass, field, fields, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import threading
+    from concurrent.futures import Future
 
-try:
     from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4, LETTER
-    from reportlab.lib.units import mm
     from reportlab.pdfgen import canvas
-except ModuleNotFoundError as err:
-    missing_module = err.name or "reportlab"
-    print(
-        f"Missing dependency '{missing_module}'. Install with: python3 -m pip install -r requirements.txt",
-        file=sys.stderr,
-    )
-    raise SystemExit(1)
+else:
+    # ReportLab is imported by _require_reportlab() when rendering starts, so
+    # parsing, validation and card generation never pay for it.
+    colors = None
+    canvas = None
+    stringWidth = None
+
+# NumPy is imported by load_numpy() when the first card batch, index or
+# archive needs it, so --help and --validate-only never pay for it.
+np = None
+_numpy_checked = False
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is simply not reported there.
+    resource = None
+
+from bingo_patterns import BitCard
+from bingo_pdfstream import StreamingPdfWriter, pdf_number, pdf_string
+
+# Same values as reportlab.lib.units.mm and reportlab.lib.pagesizes.
+mm = 72 / 25.4
+A4 = (210 * mm, 297 * mm)
+LETTER = (612.0, 792.0)
+PAPER_SIZES = {"a4": A4, "letter": LETTER}
 
 LETTERS = "BINGO"
 PRESET_COLORFUL = {
@@ -34,6 +82,89 @@ PRESET_COLORFUL = {
     "G": "#FFBF00",
     "O": "#9467BD",
 }
+FREE_CELL = 0
+# (card index, retry attempt) appended to the seed key for per-card randomness.
+_CARD_COUNTER = struct.Struct("<QI")
+# Random 32-bit words drawn per card: one per cell, consumed by partial Fisher-Yates.
+WORDS_PER_CARD = 25
+# Pages of cards generated per batch; also the shard size for --workers.
+PAGES_PER_CHUNK = 256
+# Upper bound on pool cells held at once while sampling a NumPy batch.
+POOL_BUDGET = 4_000_000
+# Below this many cards the per-call NumPy overhead outweighs vectorization.
+NUMPY_MIN_BATCH = 64
+# Upper bound on card pairs compared at once while checking --max-shared overlaps.
+OVERLAP_BUDGET = 4_000_000
+# Most memory the --max-shared incidence matrix may take (4 bytes per card and number);
+# larger runs keep per-number postings, which grow with the cards rather than the range.
+OVERLAP_DENSE_BYTES = 256_000_000
+# Redraws tried for one card before --max-shared is judged unreachable.
+MAX_SHARED_ATTEMPTS = 1000
+DISTRIBUTIONS = ("segmented", "fully-random")
+BACKENDS = ("reportlab", "fast")
+FORMATS = ("pdf", "svg")
+LETTER_COLOR_MODES = ("black", "random", "custom")
+ARCHIVE_MAGIC = b"BINGOARC"
+ARCHIVE_VERSION = 1
+# Minimum seconds between two progress callbacks, so reporting stays off the hot path.
+PROGRESS_INTERVAL = 0.25
+# Most (cell, number) text operators cached by the fast backend; past this they are rebuilt per card.
+TEXT_CACHE_LIMIT = 250_000
+# Digits of the card number in a serial; longer runs simply print wider serials.
+SERIAL_DIGITS = 7
+# Phases reported by --timings, in run order; nested phases are not counted again in the one around them.
+TIMING_PHASES = ("validate", "generate", "draw", "save")
+SERIAL_INDEX_FORMAT = "bingo-serials"
+SERIAL_INDEX_VERSION = 1
+# Damm quasigroup: its check digit catches every single-digit error and adjacent transposition.
+_DAMM_TABLE = (
+    (0, 3, 1, 7, 5, 9, 8, 6, 4, 2),
+    (7, 0, 9, 2, 1, 5, 4, 8, 6, 3),
+    (4, 2, 0, 6, 8, 7, 1, 3, 5, 9),
+    (1, 7, 5, 0, 9, 8, 3, 4, 2, 6),
+    (6, 1, 2, 3, 0, 4, 5, 9, 7, 8),
+    (3, 6, 7, 4, 2, 0, 9, 5, 8, 1),
+    (5, 8, 6, 9, 7, 2, 0, 1, 3, 4),
+    (8, 9, 4, 5, 3, 6, 2, 0, 1, 7),
+    (9, 4, 3, 8, 6, 1, 7, 2, 0, 5),
+    (2, 5, 8, 1, 4, 3, 6, 7, 9, 0),
+)
+# Config fields set by add_card_options, for tools that regenerate a run's cards.
+CARD_OPTIONS = (
+    "sheets",
+    "min_number",
+    "max_number",
+    "distribution",
+    "free_center",
+    "seed",
+    "first_card",
+    "serial_prefix",
+    "unique",
+    "max_shared",
+)
+CHECKPOINT_VERSION = 1
+# Options that change the cards or the bytes of a shard; a checkpoint only resumes a run that matches all of them.
+CHECKPOINT_OPTIONS = (
+    "sheets",
+    "sheets_per_page",
+    "paper_size",
+    "min_number",
+    "max_number",
+    "distribution",
+    "letter_color_mode",
+    "custom_letter_colors",
+    "free_center",
+    "free_center_text",
+    "unique",
+    "max_shared",
+    "first_card",
+    "stream",
+    "backend",
+    "max_pages_per_file",
+    "serial_prefix",
+)
+# magic, version, cell bytes, distribution, free center, unique, min, max, first card, count, seed.
+_ARCHIVE_HEADER = struct.Struct("<8sHBBBB2xqqQQ16s")
 
 
 @dataclass
@@ -51,31 +182,182 @@ class Config:
     free_center_text: str
     seed: Optional[int]
     assume_yes: bool
+    unique: bool = False
+    workers: Optional[int] = None
+    first_card: int = 1
+    archive: Optional[str] = None
+    stream: bool = False
+    backend: str = "reportlab"
+    format: str = "pdf"
+    max_pages_per_file: Optional[int] = None
+    resume: bool = False
+    # None prints no serials; otherwise the (possibly empty) per-event serial prefix.
+    serial_prefix: Optional[str] = None
+    max_shared: Optional[int] = None
 
 
-def parse_args(argv: Sequence[str]) -> Config:
-    parser = argparse.ArgumentParser(
-        description="Generate printable bingo sheet PDFs (A4/Letter)."
-    )
-    parser.add_argument("--output", default="bingo_sheets.pdf", help="Output PDF path")
+@dataclass
+class GenerationStats:
+    cards: int = 0
+    pages: int = 0
+    seed: Optional[int] = None
+    possible_cards: Optional[int] = None
+    unique_collisions: int = 0
+    # Most numbers any two cards share, with the redraws and seconds --max-shared took.
+    max_overlap: Optional[int] = None
+    overlap_rejections: int = 0
+    overlap_seconds: float = 0.0
+    peak_memory_mb: Optional[float] = None
+    files: int = 1
+    resumed_cards: int = 0
+    # Wall seconds per TIMING_PHASES entry, and for the whole run.
+    timings: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def cards_per_second(self) -> float:
+        """Cards drawn by this run per second; cards kept from an earlier attempt do not count."""
+        return (self.cards - self.resumed_cards) / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.cards_per_second * self.pages / self.cards if self.cards else 0.0
+
+
+@dataclass
+class Progress:
+    cards_done: int
+    total_cards: int
+    pages_done: int
+    total_pages: int
+    elapsed: float
+    # Estimated seconds left, extrapolated from the pace so far.
+    eta: float
+    # Cards a resumed run found already finished; part of cards_done but not of the pace.
+    resumed_cards: int = 0
+
+    @property
+    def cards_per_second(self) -> float:
+        return (self.cards_done - self.resumed_cards) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class GenerationCanceled(ValueError):
+    """Raised by generate_pdf when its ``cancel`` token is set while pages are drawn."""
+
+
+_T = TypeVar("_T")
+
+
+class _PhaseClock:
+    """Adds up wall time per named phase of a run.
+
+    Phases nest: time spent in an inner phase, such as generating the cards a
+    renderer pulls from its batch iterator, is not counted again in the outer
+    one, so the phases add up to the run's total.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+        self._stack: List[str] = []
+        self._started = self._since = time.perf_counter()
+
+    def _switch(self) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            name = self._stack[-1]
+            self.seconds[name] = self.seconds.get(name, 0.0) + now - self._since
+        self._since = now
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._switch()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+    def iterate(self, name: str, items: Iterable[_T]) -> Iterator[_T]:
+        """Yield from ``items``, counting the time spent producing each item as phase ``name``."""
+        iterator = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+
+# The clock of the generate_pdf call running in this thread, so renderers can time their save step.
+_PHASE_CLOCK: contextvars.ContextVar[Optional[_PhaseClock]] = contextvars.ContextVar("bingo_phase_clock", default=None)
+
+
+def _phase(name: str) -> ContextManager[None]:
+    clock = _PHASE_CLOCK.get()
+    return clock.phase(name) if clock is not None else contextlib.nullcontext()
+
+
+class _ProgressReporter:
+    """Counts finished pages, honours cancellation and throttles progress callbacks."""
+
+    def __init__(
+        self,
+        total_cards: int,
+        total_pages: int,
+        progress: Optional[Callable[[Progress], None]],
+        cancel: Optional[threading.Event],
+        resumed_cards: int = 0,
+        resumed_pages: int = 0,
+    ) -> None:
+        self.total_cards = total_cards
+        self.total_pages = total_pages
+        # Work finished by an earlier run counts toward the totals, but the pace is this run's alone.
+        self.resumed_cards = resumed_cards
+        self.cards_done = resumed_cards
+        self.pages_done = resumed_pages
+        self._progress = progress
+        self._cancel = cancel
+        self._started = time.perf_counter()
+        self._next_report = self._started
+
+    def page_done(self, cards: int) -> None:
+        if self._cancel is not None and self._cancel.is_set():
+            raise GenerationCanceled("Generation canceled by user")
+        self.cards_done += cards
+        self.pages_done += 1
+        if self._progress is None:
+            return
+        now = time.perf_counter()
+        # The last page is always reported so callers see the run reach 100%.
+        if now >= self._next_report or self.pages_done == self.total_pages:
+            self._next_report = now + PROGRESS_INTERVAL
+            elapsed = now - self._started
+            self._progress(
+                Progress(
+                    cards_done=self.cards_done,
+                    total_cards=self.total_cards,
+                    pages_done=self.pages_done,
+                    total_pages=self.total_pages,
+                    elapsed=elapsed,
+                    eta=elapsed * (self.total_cards - self.cards_done) / (self.cards_done - self.resumed_cards),
+                    resumed_cards=self.resumed_cards,
+                )
+            )
+
+
+def add_card_options(parser: argparse.ArgumentParser) -> None:
+    """Add the options that decide which cards a run holds and how they are numbered."""
     parser.add_argument(
         "--sheets",
         type=int,
         default=4,
         help="Total number of bingo sheets/cards to generate (default: 4)",
     )
-    parser.add_argument(
-        "--sheets-per-page",
-        type=int,
-        default=4,
-        help="How many sheets/cards to place on each paper page (default: 4)",
-    )
-    parser.add_argument(
-        "--paper-size",
-        choices=["a4", "letter"],
-        default="a4",
-        help="Paper size for output PDF (default: a4)",
-    )
     parser.add_argument(
         "--min-number",
         type=int,
@@ -90,16 +372,76 @@ def parse_args(argv: Sequence[str]) -> Config:
     )
     parser.add_argument(
         "--distribution",
-        choices=["segmented", "fully-random"],
+        choices=list(DISTRIBUTIONS),
         default="segmented",
         help=(
             "'segmented': each B/I/N/G/O column maps to a numeric range segment. "
             "'fully-random': any number can appear in any column."
         ),
     )
+    parser.add_argument(
+        "--free-center",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use FREE center cell (default: enabled, use --no-free-center to disable)",
+    )
+    parser.add_argument("--seed", type=int, help="Optional random seed for repeatable output")
+    parser.add_argument(
+        "--first-card",
+        type=int,
+        default=1,
+        help=(
+            "Card number to start from (default: 1). With --seed, reprints cards "
+            "first-card..first-card+sheets-1 of an earlier run exactly."
+        ),
+    )
+    parser.add_argument(
+        "--serials",
+        dest="serial_prefix",
+        nargs="?",
+        const="",
+        metavar="PREFIX",
+        help=(
+            "Print a serial such as PREFIX-0000042-7 in each card's corner and write "
+            "output_serials.idx for looking cards up by serial"
+        ),
+    )
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Guarantee that no two generated cards are identical",
+    )
+    parser.add_argument(
+        "--max-shared",
+        type=int,
+        help=(
+            "Redraw any card that shares more than N numbers with an earlier card of the run, "
+            "to cut down on tied winners (implies --unique)"
+        ),
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Generate printable bingo sheet PDFs (A4/Letter)."
+    )
+    parser.add_argument("--output", default="bingo_sheets.pdf", help="Output PDF path")
+    add_card_options(parser)
+    parser.add_argument(
+        "--sheets-per-page",
+        type=int,
+        default=4,
+        help="How many sheets/cards to place on each paper page (default: 4)",
+    )
+    parser.add_argument(
+        "--paper-size",
+        choices=list(PAPER_SIZES),
+        default="a4",
+        help="Paper size for output PDF (default: a4)",
+    )
     parser.add_argument(
         "--letter-color-mode",
-        choices=["black", "random", "custom"],
+        choices=list(LETTER_COLOR_MODES),
         default="black",
         help="BINGO letter coloring mode (default: black)",
     )
@@ -110,39 +452,180 @@ def parse_args(argv: Sequence[str]) -> Config:
             "Format: B:#1F77B4,I:#D62728,N:#2CA02C,G:#FFBF00,O:#9467BD"
         ),
     )
-    parser.add_argument(
-        "--free-center",
-        action=argparse.BooleanOptionalAction,
-        default=True,
-        help="Use FREE center cell (default: enabled, use --no-free-center to disable)",
-    )
     parser.add_argument(
         "--free-center-text",
         default="FREE",
         help="Text shown in center cell when free center is enabled (default: FREE)",
     )
-    parser.add_argument("--seed", type=int, help="Optional random seed for repeatable output")
+    parser.add_argument(
+        "--archive",
+        help="Also write every card to this fixed-width binary file for verification and audits",
+    )
+    parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="Check the configuration, print any warnings and exit without generating",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print wall time per phase (validate, generate, draw, save) with cards/s and pages/s",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help=(
+            "Write a cProfile dump of the run to PATH, for python3 -m pstats or snakeviz "
+            "(--workers processes are not profiled)"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(FORMATS),
+        default="pdf",
+        help=(
+            "'pdf': one PDF file. 'svg': one SVG file per page, named after --output "
+            "with a page number (output_0001.svg, ...) (default: pdf)"
+        ),
+    )
+    parser.add_argument(
+        "--max-pages-per-file",
+        "--shard-size",
+        type=int,
+        help=(
+            "Split the PDF into files of at most N pages (output_0001.pdf, ...) plus "
+            "output_shards.json listing each file's page and card range"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Record each finished shard in output_checkpoint.json and, when that file exists, "
+            "continue the run from the last finished shard (requires pypdf unless --max-pages-per-file is set)"
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default="reportlab",
+        help=(
+            "'reportlab': draw pages with the ReportLab canvas. 'fast': write PDF content "
+            "streams directly, several times faster with the same look (default: reportlab)"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Write pages to disk as they are drawn so memory stays flat for huge runs, "
+            "and report peak memory use (implies --backend fast)"
+        ),
+    )
     parser.add_argument(
         "--assume-yes",
         action="store_true",
         help="Skip interactive warning confirmations",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Render pages in N processes and merge them into the output (requires pypdf). "
+            "Seeded output is the same file for every N and with --resume; without --workers "
+            "it has the same cards and pages but different bytes."
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        help=(
+            "Run every job in this JSON file (a list of objects keyed by option name, "
+            "e.g. max_number) in one process; other command-line options are the defaults"
+        ),
+    )
+    parser.add_argument(
+        "--parallel-jobs",
+        type=int,
+        default=1,
+        help=(
+            "With --manifest, run up to N jobs at once in separate processes (default: 1); "
+            "--profile then covers only this process"
+        ),
+    )
 
-    args = parser.parse_args(argv)
-    return Config(**vars(args))
+    return parser
 
 
-def parse_hex_color(value: str) -> colors.Color:
+def config_from_args(args: argparse.Namespace) -> Config:
+    return Config(**{field.name: getattr(args, field.name) for field in fields(Config)})
+
+
+def parse_args(argv: Sequence[str]) -> Config:
+    return config_from_args(build_parser().parse_args(argv))
+
+
+def card_config_from_args(args: argparse.Namespace) -> Config:
+    """Config for regenerating the cards given by add_card_options; every other option keeps its default."""
+    return replace(parse_args([]), **{name: getattr(args, name) for name in CARD_OPTIONS})
+
+
+def load_numpy() -> Any:
+    """Import NumPy on first use and return it, or None when it is not installed.
+
+    NumPy is optional; the array-module fallback produces identical cards.
+    """
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ModuleNotFoundError:
+            numpy = None
+        np = numpy
+    return np
+
+
+def _is_ndarray(cells: Any) -> bool:
+    """Whether ``cells`` is a NumPy array.
+
+    Loads NumPy first: a worker started with the spawn method receives pickled
+    arrays before anything in it has called load_numpy().
+    """
+    return load_numpy() is not None and isinstance(cells, np.ndarray)
+
+
+def _require_reportlab() -> None:
+    global colors, canvas, stringWidth
+    if canvas is not None:
+        return
+    try:
+        from reportlab.lib import colors as rl_colors
+        from reportlab.pdfbase.pdfmetrics import stringWidth as rl_string_width
+        from reportlab.pdfgen import canvas as rl_canvas
+    except ModuleNotFoundError as err:
+        missing_module = err.name or "reportlab"
+        raise ValueError(
+            f"Missing dependency '{missing_module}'. Install with: python3 -m pip install -r requirements.txt"
+        ) from err
+    colors, stringWidth, canvas = rl_colors, rl_string_width, rl_canvas
+
+
+def _check_hex_color(value: str) -> str:
     if not re.fullmatch(r"#[0-9A-Fa-f]{6}", value):
         raise ValueError(f"Invalid color '{value}', expected #RRGGBB")
-    return colors.HexColor(value)
+    return value
 
 
-def parse_custom_letter_colors(spec: Optional[str]) -> Dict[str, colors.Color]:
+def parse_hex_color(value: str) -> colors.Color:
+    _require_reportlab()
+    return colors.HexColor(_check_hex_color(value))
+
+
+def _custom_letter_hex(spec: Optional[str]) -> Dict[str, str]:
     if not spec:
         raise ValueError("--custom-letter-colors is required when --letter-color-mode custom")
 
-    result: Dict[str, colors.Color] = {}
+    result: Dict[str, str] = {}
     for item in spec.split(","):
         if ":" not in item:
             raise ValueError(f"Invalid custom color entry '{item}', expected KEY:#RRGGBB")
@@ -150,7 +633,7 @@ def parse_custom_letter_colors(spec: Optional[str]) -> Dict[str, colors.Color]:
         letter = key.strip().upper()
         if letter not in LETTERS:
             raise ValueError(f"Invalid letter '{letter}', allowed letters are B,I,N,G,O")
-        result[letter] = parse_hex_color(raw_color.strip())
+        result[letter] = _check_hex_color(raw_color.strip())
 
     missing = [letter for letter in LETTERS if letter not in result]
     if missing:
@@ -159,7 +642,12 @@ def parse_custom_letter_colors(spec: Optional[str]) -> Dict[str, colors.Color]:
     return result
 
 
+def parse_custom_letter_colors(spec: Optional[str]) -> Dict[str, colors.Color]:
+    return {letter: parse_hex_color(hex_code) for letter, hex_code in _custom_letter_hex(spec).items()}
+
+
 def random_letter_colors(rng: random.Random) -> Dict[str, colors.Color]:
+    _require_reportlab()
     mapping: Dict[str, colors.Color] = {}
     for letter in LETTERS:
         # Keep colors bright enough for printing readability.
@@ -170,6 +658,33 @@ def random_letter_colors(rng: random.Random) -> Dict[str, colors.Color]:
     return mapping
 
 
+def serial_check_digit(digits: str) -> int:
+    interim = 0
+    for digit in digits:
+        interim = _DAMM_TABLE[interim][int(digit)]
+    return interim
+
+
+def format_serial(card_number: int, prefix: str = "") -> str:
+    """Serial of a card: optional prefix, zero-padded card number and a Damm check digit."""
+    digits = f"{card_number:0{SERIAL_DIGITS}d}"
+    serial = f"{digits}-{serial_check_digit(digits)}"
+    return f"{prefix}-{serial}" if prefix else serial
+
+
+def parse_serial(serial: str) -> Tuple[str, int]:
+    """Return (prefix, card number) of a serial, rejecting malformed or misread ones."""
+    parts = serial.strip().upper().split("-")
+    if len(parts) == 2:
+        parts.insert(0, "")
+    if len(parts) != 3 or not parts[1].isdigit() or len(parts[2]) != 1 or not parts[2].isdigit():
+        raise ValueError(f"'{serial}' is not a card serial")
+    prefix, digits, check = parts
+    if serial_check_digit(digits + check) != 0:
+        raise ValueError(f"Serial '{serial}' fails its check digit; it was probably misread")
+    return prefix, int(digits)
+
+
 def segment_ranges(min_number: int, max_number: int, parts: int = 5) -> List[List[int]]:
     numbers = list(range(min_number, max_number + 1))
     total = len(numbers)
@@ -202,6 +717,57 @@ def validate_config(config: Config) -> List[List[int]]:
         raise ValueError("--sheets must be greater than 0")
     if config.sheets_per_page <= 0:
         raise ValueError("--sheets-per-page must be greater than 0")
+    if config.first_card <= 0:
+        raise ValueError("--first-card must be greater than 0")
+    # Card indexes are packed as unsigned 64-bit counters when deriving each card.
+    if config.first_card - 1 + config.sheets > 2**64:
+        raise ValueError("--first-card plus --sheets must not go past card 2**64")
+    if config.paper_size not in PAPER_SIZES:
+        raise ValueError(f"--paper-size must be one of: {', '.join(PAPER_SIZES)}")
+    if config.distribution not in DISTRIBUTIONS:
+        raise ValueError(f"--distribution must be one of: {', '.join(DISTRIBUTIONS)}")
+    if config.letter_color_mode not in LETTER_COLOR_MODES:
+        raise ValueError(f"--letter-color-mode must be one of: {', '.join(LETTER_COLOR_MODES)}")
+    if config.backend not in BACKENDS:
+        raise ValueError(f"--backend must be one of: {', '.join(BACKENDS)}")
+    if config.format not in FORMATS:
+        raise ValueError(f"--format must be one of: {', '.join(FORMATS)}")
+    if config.letter_color_mode == "custom":
+        _custom_letter_hex(config.custom_letter_colors)
+    if config.archive:
+        # The archive header stores the seed in 16 signed bytes, the number range
+        # as signed 64-bit values and the first card as an unsigned one.
+        if config.seed is not None and not -(2**127) <= config.seed < 2**127:
+            raise ValueError("--archive needs a --seed between -2**127 and 2**127 - 1")
+        if not -(2**63) <= config.min_number and config.max_number < 2**63:
+            raise ValueError("--archive needs --min-number and --max-number between -2**63 and 2**63 - 1")
+        if config.first_card >= 2**64:
+            raise ValueError("--archive needs a --first-card below 2**64")
+    if config.serial_prefix is not None and not re.fullmatch(r"[A-Z0-9]{0,12}", config.serial_prefix):
+        raise ValueError("--serials prefix must be up to 12 uppercase letters or digits")
+    if config.max_pages_per_file is not None:
+        if config.max_pages_per_file <= 0:
+            raise ValueError("--max-pages-per-file must be greater than 0")
+        if config.format != "pdf":
+            raise ValueError("--max-pages-per-file only applies to PDF output")
+    if config.workers is not None:
+        if config.workers <= 0:
+            raise ValueError("--workers must be greater than 0")
+        if config.format != "pdf":
+            raise ValueError("--workers only applies to PDF output")
+        # Split output needs no merge step, so pypdf is only needed for a single file.
+        if config.max_pages_per_file is None and importlib.util.find_spec("pypdf") is None:
+            raise ValueError("--workers requires pypdf. Install with: python3 -m pip install pypdf")
+    if config.resume:
+        if config.format != "pdf":
+            raise ValueError("--resume only applies to PDF output")
+        if config.max_pages_per_file is None and importlib.util.find_spec("pypdf") is None:
+            raise ValueError(
+                "--resume requires pypdf unless --max-pages-per-file is set. Install with: python3 -m pip install pypdf"
+            )
+    # Merging shards into one file holds every page in memory, which defeats --stream.
+    if config.stream and config.max_pages_per_file is None and (config.workers is not None or config.resume):
+        raise ValueError("--stream cannot be combined with --workers or --resume unless --max-pages-per-file is set")
     if config.max_number < config.min_number:
         raise ValueError("--max-number must be >= --min-number")
 
@@ -222,9 +788,30 @@ def validate_config(config: Config) -> List[List[int]]:
                     f"Not enough numbers in column {letter} range: need {need}, got {len(bucket)}"
                 )
 
+    if config.max_shared is not None and not 0 <= config.max_shared < required_cells:
+        raise ValueError(f"--max-shared must be between 0 and {required_cells - 1} for this card layout")
+
+    if config.unique:
+        possible = possible_card_count(config, segments)
+        if config.sheets > possible:
+            raise ValueError(
+                f"--unique requested {config.sheets} sheet(s) but this range only allows {possible} distinct card(s)"
+            )
+
     return segments
 
 
+def possible_card_count(config: Config, segments: List[List[int]]) -> int:
+    if config.distribution == "segmented":
+        required_per_col = [5, 5, 4, 5, 5] if config.free_center else [5, 5, 5, 5, 5]
+        total = 1
+        for bucket, need in zip(segments, required_per_col):
+            total *= math.comb(len(bucket), need)
+        return total
+    required_cells = 24 if config.free_center else 25
+    return math.perm(config.max_number - config.min_number + 1, required_cells)
+
+
 def collect_warnings(config: Config) -> List[str]:
     warnings: List[str] = []
 
@@ -253,39 +840,489 @@ def collect_warnings(config: Config) -> List[str]:
     return warnings
 
 
-def generate_card(
-    rng: random.Random,
+@dataclass
+class CardBatch:
+    """N cards stored as one compact (N, 5, 5) matrix.
+
+    Cells hold 1-based offsets into the number range (``number - min_number + 1``)
+    and ``FREE_CELL`` (0) marks the free center. ``cells`` is a NumPy array when
+    NumPy is installed, otherwise a flat ``array.array`` in row-major order.
+    ``start`` is the 0-based position of the first card in its card sequence.
+    """
+
+    cells: Any
+    count: int
+    min_number: int
+    start: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[List[List[Optional[int]]]]:
+        return iter(self.to_lists())
+
+    def card(self, index: int) -> List[List[Optional[int]]]:
+        return _offsets_to_card(self.card_offsets(index), self.min_number)
+
+    def fingerprint(self, index: int) -> bytes:
+        """Canonical identity of a card: its raw cell bytes.
+
+        Segmented columns are sorted and fully random cards keep their layout,
+        so two cards print identically exactly when their fingerprints match.
+        """
+        if _is_ndarray(self.cells):
+            return self.cells[index].tobytes()
+        return self.cells[index * 25 : (index + 1) * 25].tobytes()
+
+    def set_card(self, index: int, other: CardBatch, other_index: int) -> None:
+        if _is_ndarray(self.cells):
+            if isinstance(other.cells, np.ndarray):
+                self.cells[index] = other.cells[other_index]
+            else:
+                self.cells[index] = np.asarray(other.card_offsets(other_index)).reshape(5, 5)
+        else:
+            self.cells[index * 25 : (index + 1) * 25] = array(self.cells.typecode, other.card_offsets(other_index))
+
+    @classmethod
+    def concat(cls, batches: Sequence[CardBatch], min_number: int) -> CardBatch:
+        count = sum(len(batch) for batch in batches)
+        start = batches[0].start if batches else 0
+        if load_numpy() is not None and count >= NUMPY_MIN_BATCH:
+            parts = [np.asarray(batch.cells).reshape(len(batch), 5, 5) for batch in batches]
+            return cls(cells=np.concatenate(parts), count=count, min_number=min_number, start=start)
+        cells = array("I")
+        for batch in batches:
+            cells.extend(batch.card_offsets(index)[cell] for index in range(len(batch)) for cell in range(25))
+        return cls(cells=cells, count=count, min_number=min_number, start=start)
+
+    def to_bytes(self, cell_bytes: int) -> bytes:
+        """Serialize the cells row-major as little-endian unsigned integers."""
+        if _is_ndarray(self.cells):
+            return self.cells.astype(f"<u{cell_bytes}", copy=False).tobytes()
+        typecode = {1: "B", 2: "H", 4: "I"}[cell_bytes]
+        cells = self.cells if self.cells.typecode == typecode else array(typecode, self.cells)
+        if sys.byteorder == "big":
+            cells = array(typecode, cells)
+            cells.byteswap()
+        return cells.tobytes()
+
+    def subset(self, start: int, stop: int) -> CardBatch:
+        """Cards ``start`` to ``stop`` as a new batch sharing this batch's storage where possible."""
+        if _is_ndarray(self.cells):
+            cells = self.cells[start:stop]
+        else:
+            cells = self.cells[start * 25 : stop * 25]
+        return CardBatch(cells=cells, count=stop - start, min_number=self.min_number, start=self.start + start)
+
+    def cell_keys(self) -> List[List[int]]:
+        """Per card, ``offset * 25 + cell`` for each of its 25 cells in row-major order."""
+        if _is_ndarray(self.cells):
+            keys = self.cells.reshape(self.count, 25).astype(np.int64) * 25 + np.arange(25)
+            return keys.tolist()
+        return [
+            [offset * 25 + cell for cell, offset in enumerate(self.cells[index * 25 : (index + 1) * 25])]
+            for index in range(self.count)
+        ]
+
+    def card_offsets(self, index: int) -> List[int]:
+        if _is_ndarray(self.cells):
+            return self.cells[index].ravel().tolist()
+        return self.cells[index * 25 : (index + 1) * 25].tolist()
+
+    def to_lists(self) -> List[List[List[Optional[int]]]]:
+        if _is_ndarray(self.cells):
+            flat = self.cells.reshape(self.count, 25).tolist()
+            return [_offsets_to_card(offsets, self.min_number) for offsets in flat]
+        cells = self.cells
+        return [
+            _offsets_to_card(cells[i * 25 : (i + 1) * 25].tolist(), self.min_number)
+            for i in range(self.count)
+        ]
+
+
+def _offsets_to_card(offsets: List[int], min_number: int) -> List[List[Optional[int]]]:
+    base = min_number - 1
+    values = [None if offset == FREE_CELL else offset + base for offset in offsets]
+    return [values[row * 5 : row * 5 + 5] for row in range(5)]
+
+
+def _cell_typecode(span: int) -> str:
+    if span <= 0xFF:
+        return "B"
+    if span <= 0xFFFF:
+        return "H"
+    return "I"
+
+
+def _sampling_groups(
     min_number: int,
     max_number: int,
     distribution: str,
     segments: List[List[int]],
     free_center: bool,
-) -> List[List[Optional[int]]]:
-    card: List[List[Optional[int]]] = [[None for _ in range(5)] for _ in range(5)]
-
+) -> List[Tuple[int, int, int, List[int], bool]]:
+    """Describe the draws that fill one card.
+
+    Each group is ``(word_start, first_offset, pool_size, cell_indices, sort)``:
+    a partial Fisher-Yates draw of ``len(cell_indices)`` values from a pool of
+    ``pool_size`` offsets starting at ``first_offset``, using the card's random
+    words from ``word_start`` onwards.
+    """
     if distribution == "segmented":
+        groups = []
         for col in range(5):
-            need = 4 if (free_center and col == 2) else 5
-            chosen = sorted(rng.sample(segments[col], need))
-            row_indices = [0, 1, 2, 3, 4]
-            if free_center and col == 2:
-                row_indices.remove(2)
-            for row, value in zip(row_indices, chosen):
-                card[row][col] = value
-    else:
-        pool = list(range(min_number, max_number + 1))
-        total_numbers = 24 if free_center else 25
-        chosen = rng.sample(pool, total_numbers)
-        rng.shuffle(chosen)
-        i = 0
-        for row in range(5):
-            for col in range(5):
-                if free_center and row == 2 and col == 2:
-                    continue
-                card[row][col] = chosen[i]
-                i += 1
+            rows = [0, 1, 3, 4] if (free_center and col == 2) else [0, 1, 2, 3, 4]
+            first_offset = segments[col][0] - min_number + 1
+            cell_indices = [row * 5 + col for row in rows]
+            groups.append((col * 5, first_offset, len(segments[col]), cell_indices, True))
+        return groups
+    cell_indices = [i for i in range(25) if not (free_center and i == 12)]
+    return [(0, 1, max_number - min_number + 1, cell_indices, False)]
+
+
+def _words_array(raw: bytes) -> array:
+    words = array("I", raw)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+
+class CardSampler:
+    """Fills cards from random words for one number range and distribution.
+
+    Built once per run: the sampling groups, an identity pool per group for
+    single cards and reusable pool buffers for NumPy batches are prepared up
+    front, so drawing cards rebuilds no lists. Every draw is the same partial
+    Fisher-Yates over the card's words, so a seed always gives the same cards.
+    """
+
+    def __init__(
+        self,
+        min_number: int,
+        max_number: int,
+        distribution: str,
+        segments: List[List[int]],
+        free_center: bool,
+    ) -> None:
+        self.min_number = min_number
+        self.typecode = _cell_typecode(max_number - min_number + 1)
+        self.groups = _sampling_groups(min_number, max_number, distribution, segments, free_center)
+        # Identity pools for the pure-Python path; each draw shuffles a slice copy.
+        self._pools = {pool_size: list(range(pool_size)) for _, _, pool_size, _, _ in self.groups}
+        # pool size -> (pool rows, flat offset of each row), grown to the largest batch seen.
+        self._buffers: Dict[int, Tuple[Any, Any]] = {}
+
+    def _sample_numpy(self, words: Any, pool_size: int, picks: int) -> Any:
+        """Partial Fisher-Yates over every row of ``words`` at once.
+
+        Pools use the cell dtype and are swapped through flat indices, which
+        keeps the per-pick gathers and scatters small and contiguous. The
+        result is a view into a reused buffer, valid until the next call.
+        """
+        count = words.shape[0]
+        pool, base = self._buffers.get(pool_size, (None, None))
+        if pool is None or len(pool) < count:
+            dtype = {"B": np.uint8, "H": np.uint16, "I": np.uint32}[self.typecode]
+            pool = np.empty((count, pool_size), dtype=dtype)
+            base = np.arange(0, count * pool_size, pool_size, dtype=np.intp)
+            self._buffers[pool_size] = (pool, base)
+        pool = pool[:count]
+        base = base[:count]
+        pool[:] = np.arange(pool_size, dtype=pool.dtype)
+        flat = pool.reshape(-1)
+        for j in range(picks):
+            swap = words[:, j] % np.uint32(pool_size - j) + base
+            swap += j
+            picked = flat[swap]
+            flat[swap] = pool[:, j]
+            pool[:, j] = picked
+        return pool[:, :picks]
+
+    def _sample(self, words: Sequence[int], start: int, pool_size: int, picks: int) -> List[int]:
+        # Copying the prepared pool is cheaper than rebuilding it or undoing the swaps afterwards.
+        pool = self._pools[pool_size][:]
+        for j in range(picks):
+            swap = j + words[start + j] % (pool_size - j)
+            pool[j], pool[swap] = pool[swap], pool[j]
+        return pool[:picks]
+
+    def cards(self, raw_words: bytes, count: int) -> CardBatch:
+        """Build ``count`` cards from ``WORDS_PER_CARD`` little-endian 32-bit words each."""
+        if load_numpy() is not None and count >= NUMPY_MIN_BATCH:
+            dtype = {"B": np.uint8, "H": np.uint16, "I": np.uint32}[self.typecode]
+            words = np.frombuffer(raw_words, dtype="<u4").reshape(count, WORDS_PER_CARD)
+            cells = np.zeros((count, 25), dtype=dtype)
+            for word_start, first_offset, pool_size, cell_indices, ordered in self.groups:
+                picks = len(cell_indices)
+                chunk = max(1, POOL_BUDGET // pool_size)
+                for start in range(0, count, chunk):
+                    stop = min(count, start + chunk)
+                    chosen = self._sample_numpy(words[start:stop, word_start : word_start + picks], pool_size, picks)
+                    if ordered:
+                        chosen.sort(axis=1)
+                    cells[start:stop, cell_indices] = chosen + dtype(first_offset)
+            return CardBatch(cells=cells.reshape(count, 5, 5), count=count, min_number=self.min_number)
+
+        words = _words_array(raw_words)
+        cells = array(self.typecode, [FREE_CELL]) * (25 * count)
+        for card_idx in range(count):
+            base = card_idx * 25
+            word_base = card_idx * WORDS_PER_CARD
+            for word_start, first_offset, pool_size, cell_indices, ordered in self.groups:
+                chosen = self._sample(words, word_base + word_start, pool_size, len(cell_indices))
+                if ordered:
+                    chosen.sort()
+                for cell, value in zip(cell_indices, chosen):
+                    cells[base + cell] = value + first_offset
+        return CardBatch(cells=cells, count=count, min_number=self.min_number)
+
+
+def generate_cards(
+    rng: random.Random,
+    count: int,
+    min_number: int,
+    max_number: int,
+    distribution: str,
+    segments: List[List[int]],
+    free_center: bool,
+) -> CardBatch:
+    """Generate ``count`` cards in one batch from a sequential random stream.
+
+    Every cell consumes one random 32-bit word, so splitting a run into several
+    batches yields exactly the same cards as generating it in one go.
+    """
+    raw_words = rng.randbytes(count * WORDS_PER_CARD * 4)
+    key = tuple(tuple(segment) for segment in segments)
+    return _shared_sampler(min_number, max_number, distribution, key, free_center).cards(raw_words, count)
+
+
+@functools.lru_cache(maxsize=16)
+def _shared_sampler(
+    min_number: int,
+    max_number: int,
+    distribution: str,
+    segments: Tuple[Tuple[int, ...], ...],
+    free_center: bool,
+) -> CardSampler:
+    """The CardSampler generate_cards reuses across calls with the same card options."""
+    return CardSampler(min_number, max_number, distribution, [list(segment) for segment in segments], free_center)
+
+
+class CardSequence:
+    """Random-access cards derived from a seed.
+
+    Card ``index`` is drawn from SHAKE-128 of (seed, index, attempt), so any
+    card can be regenerated in O(1) without replaying the cards before it, and
+    disjoint index ranges can be generated independently.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int],
+        min_number: int,
+        max_number: int,
+        distribution: str,
+        segments: List[List[int]],
+        free_center: bool,
+    ) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.min_number = min_number
+        self.max_number = max_number
+        self.distribution = distribution
+        self.segments = segments
+        self.free_center = free_center
+        self._key = f"bingo-card:{seed}:".encode("ascii")
+        self.sampler = CardSampler(min_number, max_number, distribution, segments, free_center)
+
+    def _words(self, index: int, attempt: int) -> bytes:
+        return hashlib.shake_128(self._key + _CARD_COUNTER.pack(index, attempt)).digest(WORDS_PER_CARD * 4)
+
+    def _build(self, raw_words: bytes, count: int) -> CardBatch:
+        return self.sampler.cards(raw_words, count)
+
+    def batch(self, start: int, count: int) -> CardBatch:
+        words = self._words
+        batch = self._build(b"".join(words(index, 0) for index in range(start, start + count)), count)
+        batch.start = start
+        return batch
+
+    def variant(self, index: int, attempt: int) -> CardBatch:
+        """Return card ``index`` redrawn for the given retry ``attempt`` as a one-card batch."""
+        return self._build(self._words(index, attempt), 1)
+
+    def __getitem__(self, index: int) -> List[List[Optional[int]]]:
+        return self.variant(index, 0).card(0)
+
+
+class UniqueCardIndex:
+    """Hash set of card fingerprints that keeps a run free of duplicate cards."""
+
+    def __init__(self) -> None:
+        self._seen: set = set()
+        self.collisions = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add_batch(self, batch: CardBatch, regenerate: Callable[[int, int], CardBatch]) -> None:
+        """Record every card in ``batch``, replacing duplicates in place.
+
+        ``regenerate(position, attempt)`` must return a one-card batch with a
+        redraw of the card at ``position``. Cards are settled strictly in order,
+        so the result does not depend on how a run is split into batches.
+        """
+        seen = self._seen
+        for position in range(len(batch)):
+            key = batch.fingerprint(position)
+            attempt = 0
+            while key in seen:
+                attempt += 1
+                self.collisions += 1
+                fresh = regenerate(position, attempt)
+                key = fresh.fingerprint(0)
+                if key not in seen:
+                    batch.set_card(position, fresh, 0)
+            seen.add(key)
+
+
+class OverlapIndex:
+    """Keeps any two cards of a run from sharing more than ``max_shared`` numbers.
+
+    Every accepted card is a 0/1 row of a number-incidence matrix, so the
+    numbers a whole batch of new cards shares with every accepted card are one
+    blocked matrix product (counting per-number postings in dense form, done
+    by BLAS) instead of a Python loop over card pairs. Dense rows cost
+    ``4 * span`` bytes per card, so a run whose matrix would exceed
+    ``OVERLAP_DENSE_BYTES`` keeps sparse postings instead: the accepted cards
+    holding each number, counted per new card with one bincount. Without
+    NumPy the rows are BitCard number masks compared by popcount.
+    """
+
+    def __init__(self, max_shared: int, span: int, cards: int) -> None:
+        self.max_shared = max_shared
+        self.rejections = 0
+        self.max_overlap = 0
+        self.seconds = 0.0
+        self._count = 0
+        self._postings: Optional[List[array]] = None
+        self._dense = False
+        if load_numpy() is not None and cards * span * 4 > OVERLAP_DENSE_BYTES:
+            # Indexed by cell offset; offset 0 is the free center, which holds no number.
+            self._postings = [array("I") for _ in range(span + 1)]
+        elif np is not None:
+            self._dense = True
+            # float32 holds the small integer counts exactly and keeps the product on the BLAS fast path.
+            self._rows: Any = np.zeros((1024, span), dtype=np.float32)
+        else:
+            self._rows = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _encode(self, batch: CardBatch) -> Any:
+        if self._postings is not None:
+            return [[offset for offset in batch.card_offsets(index) if offset] for index in range(len(batch))]
+        if not self._dense:
+            return [BitCard(batch.card_offsets(index)).numbers for index in range(len(batch))]
+        offsets = np.asarray(batch.cells).reshape(len(batch), 25).astype(np.intp)
+        rows = np.zeros((len(batch), self._rows.shape[1] + 1), dtype=np.float32)
+        rows[np.arange(len(batch))[:, None], offsets] = 1
+        # Column 0 is the free center, which holds no number.
+        return np.ascontiguousarray(rows[:, 1:])
+
+    def _shared(self, bits: Any, start: int, stop: int) -> Any:
+        """Most numbers each row of ``bits`` shares with accepted cards ``start`` to ``stop``."""
+        best = np.zeros(len(bits), dtype=np.float32)
+        step = max(1, OVERLAP_BUDGET // len(bits))
+        for block in range(start, stop, step):
+            np.maximum(best, (self._rows[block : min(block + step, stop)] @ bits.T).max(axis=0), out=best)
+        return best.astype(np.int64)
+
+    def _overlap(self, card: Any) -> int:
+        """Most numbers one encoded card shares with any accepted card, for the sparse and bitmask forms."""
+        if self._postings is not None:
+            # The views are dropped before _accept appends, which a live buffer export would block.
+            ids = np.concatenate([np.frombuffer(self._postings[offset], dtype=np.uint32) for offset in card])
+            return int(np.bincount(ids).max()) if len(ids) else 0
+        return max(((card & row).bit_count() for row in self._rows), default=0)
+
+    def _accept(self, card: Any) -> None:
+        if self._postings is not None:
+            for offset in card:
+                self._postings[offset].append(self._count)
+        elif not self._dense:
+            self._rows.append(card)
+        else:
+            if self._count == len(self._rows):
+                self._rows = np.concatenate((self._rows, np.zeros_like(self._rows)))
+            self._rows[self._count] = card
+        self._count += 1
+
+    def add_batch(self, batch: CardBatch, regenerate: Callable[[int, int], CardBatch]) -> None:
+        """Record every card in ``batch``, redrawing in place those that overlap an earlier card too much.
+
+        Takes the same ``regenerate(position, attempt)`` callback as
+        UniqueCardIndex.add_batch and likewise settles cards strictly in order.
+        """
+        started = time.perf_counter()
+        encoded = self._encode(batch)
+        first = self._count
+        if self._dense:
+            # Overlaps with cards accepted before this batch, for the whole batch in one pass.
+            earlier = self._shared(encoded, 0, first).tolist()
+        for position in range(len(batch)):
+            card = encoded[position]
+            if self._dense:
+                overlap = max(earlier[position], int(self._shared(card[None, :], first, self._count)[0]))
+            else:
+                overlap = self._overlap(card)
+            attempt = 0
+            while overlap > self.max_shared:
+                attempt += 1
+                self.rejections += 1
+                if attempt > MAX_SHARED_ATTEMPTS:
+                    raise ValueError(
+                        f"No card found sharing at most {self.max_shared} numbers with the "
+                        f"{self._count} card(s) before it after {MAX_SHARED_ATTEMPTS} redraws; "
+                        "raise --max-shared or generate fewer sheets"
+                    )
+                fresh = regenerate(position, attempt)
+                card = self._encode(fresh)[0]
+                if self._dense:
+                    overlap = int(self._shared(card[None, :], 0, self._count)[0])
+                else:
+                    overlap = self._overlap(card)
+                if overlap <= self.max_shared:
+                    batch.set_card(position, fresh, 0)
+            self._accept(card)
+            self.max_overlap = max(self.max_overlap, overlap)
+        self.seconds += time.perf_counter() - started
+
+
+def _card_index(config: Config) -> Union[UniqueCardIndex, OverlapIndex, None]:
+    """The index that screens the cards of a run, if its options ask for one."""
+    if config.max_shared is not None:
+        # Identical cards share every number, so this also keeps the run unique.
+        # Screening replays every card from the first, so the index ends up holding all of them.
+        span = config.max_number - config.min_number + 1
+        return OverlapIndex(config.max_shared, span, config.first_card - 1 + config.sheets)
+    if config.unique:
+        return UniqueCardIndex()
+    return None
 
-    return card
+
+def generate_card(
+    rng: random.Random,
+    min_number: int,
+    max_number: int,
+    distribution: str,
+    segments: List[List[int]],
+    free_center: bool,
+) -> List[List[Optional[int]]]:
+    batch = generate_cards(rng, 1, min_number, max_number, distribution, segments, free_center)
+    return batch.card(0)
 
 
 def choose_grid(sheets_per_page: int, page_w: float, page_h: float) -> Tuple[int, int]:
@@ -306,142 +1343,1312 @@ def choose_grid(sheets_per_page: int, page_w: float, page_h: float) -> Tuple[int
     return best_cols, best_rows
 
 
-def draw_card(
+@dataclass(frozen=True)
+class CardGeometry:
+    """Where everything on a card goes, relative to the card's lower-left corner.
+
+    Every renderer draws from this one description, so PDF, SVG or raster
+    output share exactly the same geometry.
+    """
+
+    width: float
+    height: float
+    padding: float
+    title_h: float
+    grid_h: float
+    col_w: float
+    cell_h: float
+    header_font_size: float
+    number_font_size: float
+    free_font_size: float
+    # Baseline centre of each BINGO letter.
+    header_centres: Tuple[Tuple[float, float], ...]
+    # Baseline centre of the text in each of the 25 cells, row-major from the top row.
+    cell_centres: Tuple[Tuple[float, float], ...]
+    # (x1, y1, x2, y2) of the six horizontal then six vertical grid lines.
+    grid_lines: Tuple[Tuple[float, float, float, float], ...]
+    serial_font_size: float
+    # Baseline right end of the serial, in the top padding above the header.
+    serial_anchor: Tuple[float, float]
+
+
+@functools.lru_cache(maxsize=64)
+def card_geometry(width: float, height: float) -> CardGeometry:
+    padding = 4 * mm
+    inner_w = width - 2 * padding
+    inner_h = height - 2 * padding
+    title_h = inner_h * 0.18
+    grid_h = inner_h - title_h - (2 * mm)
+    col_w = inner_w / 5.0
+    cell_h = grid_h / 5.0
+    header_y = padding + grid_h + title_h * 0.35
+    return CardGeometry(
+        width=width,
+        height=height,
+        padding=padding,
+        title_h=title_h,
+        grid_h=grid_h,
+        col_w=col_w,
+        cell_h=cell_h,
+        header_font_size=max(10, min(26, title_h * 0.45)),
+        number_font_size=max(8, min(18, cell_h * 0.4)),
+        free_font_size=max(7, min(14, cell_h * 0.3)),
+        header_centres=tuple((padding + (col + 0.5) * col_w, header_y) for col in range(5)),
+        cell_centres=tuple(
+            (padding + (col + 0.5) * col_w, padding + (4 - row + 0.5) * cell_h) for row in range(5) for col in range(5)
+        ),
+        grid_lines=tuple((padding, padding + r * cell_h, padding + inner_w, padding + r * cell_h) for r in range(6))
+        + tuple((padding + col * col_w, padding, padding + col * col_w, padding + grid_h) for col in range(6)),
+        serial_font_size=6,
+        serial_anchor=(width - padding, height - padding * 0.75),
+    )
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    page_size: Tuple[float, float]
+    cols: int
+    rows: int
+    # Lower-left corner of every card slot, in drawing order.
+    slots: Tuple[Tuple[float, float], ...]
+    card: CardGeometry
+
+
+@functools.lru_cache(maxsize=64)
+def page_layout(paper_size: str, sheets_per_page: int) -> PageLayout:
+    """Geometry shared by every page of a run with this paper size and card count."""
+    page_w, page_h = PAPER_SIZES[paper_size]
+    cols, rows = choose_grid(sheets_per_page, page_w, page_h)
+
+    margin = 8 * mm
+    gap = 4 * mm
+    usable_w = page_w - 2 * margin - (cols - 1) * gap
+    usable_h = page_h - 2 * margin - (rows - 1) * gap
+    card_w = usable_w / cols
+    card_h = usable_h / rows
+
+    slots = []
+    for idx_on_page in range(sheets_per_page):
+        row = idx_on_page // cols
+        col = idx_on_page % cols
+        x = margin + col * (card_w + gap)
+        y_top = page_h - margin - row * (card_h + gap)
+        slots.append((x, y_top - card_h))
+    return PageLayout(
+        page_size=(page_w, page_h),
+        cols=cols,
+        rows=rows,
+        slots=tuple(slots),
+        card=card_geometry(card_w, card_h),
+    )
+
+
+def card_frame_form(
     c: canvas.Canvas,
-    x: float,
-    y: float,
     w: float,
     h: float,
-    card: List[List[Optional[int]]],
     letter_colors: Dict[str, colors.Color],
-    free_center: bool,
-    free_center_text: str,
-) -> None:
-    padding = 4 * mm
-    inner_x = x + padding
-    inner_y = y + padding
-    inner_w = w - 2 * padding
-    inner_h = h - 2 * padding
-
+) -> str:
+    """Return the name of a form XObject holding the static parts of a card.
+
+    The outer border, grid lines and BINGO header are identical for every card
+    of a layout, so they are drawn once per document and reused with doForm.
+    """
+    _require_reportlab()
+    color_key = "".join(letter_colors.get(letter, colors.black).hexval()[2:] for letter in LETTERS)
+    name = f"BingoFrame{round(w * 100)}x{round(h * 100)}c{color_key}"
+    if c.hasForm(name):
+        return name
+
+    geometry = card_geometry(w, h)
+
+    # Leave room for the border stroke that straddles the card edge.
+    c.beginForm(name, lowerx=-1, lowery=-1, upperx=w + 1, uppery=h + 1)
     c.setStrokeColor(colors.black)
     c.setLineWidth(1)
-    c.rect(x, y, w, h)
-
-    title_h = inner_h * 0.18
-    grid_h = inner_h - title_h - (2 * mm)
-    col_w = inner_w / 5.0
-    cell_h = grid_h / 5.0
+    c.rect(0, 0, w, h)
 
     # Header letters B I N G O.
-    header_font_size = max(10, min(26, title_h * 0.45))
-    c.setFont("Helvetica-Bold", header_font_size)
-    for col, letter in enumerate(LETTERS):
+    c.setFont("Helvetica-Bold", geometry.header_font_size)
+    for letter, (cx, cy) in zip(LETTERS, geometry.header_centres):
         c.setFillColor(letter_colors.get(letter, colors.black))
-        cx = inner_x + (col + 0.5) * col_w
-        cy = inner_y + grid_h + title_h * 0.35
         c.drawCentredString(cx, cy, letter)
 
-    # Grid and values.
-    c.setFillColor(colors.black)
-    c.setFont("Helvetica", max(8, min(18, cell_h * 0.4)))
+    for x1, y1, x2, y2 in geometry.grid_lines:
+        c.line(x1, y1, x2, y2)
+    c.endForm()
+    return name
+
 
-    grid_y = inner_y
-    for r in range(6):
-        yy = grid_y + r * cell_h
-        c.line(inner_x, yy, inner_x + inner_w, yy)
-    for col in range(6):
-        xx = inner_x + col * col_w
-        c.line(xx, grid_y, xx, grid_y + grid_h)
+def draw_card(
+    c: canvas.Canvas,
+    x: float,
+    y: float,
+    w: float,
+    h: float,
+    card: List[List[Optional[int]]],
+    letter_colors: Dict[str, colors.Color],
+    free_center: bool,
+    free_center_text: str,
+    frame: Optional[str] = None,
+    serial: Optional[str] = None,
+) -> None:
+    """Draw one card with its lower-left corner at (x, y).
+
+    ``frame`` is the card_frame_form name for this size and colors; callers
+    drawing many cards pass it to skip the per-card lookup. ``serial`` is
+    printed small in the top right corner.
+    """
+    _require_reportlab()
+    geometry = card_geometry(w, h)
+    if frame is None:
+        frame = card_frame_form(c, w, h, letter_colors)
+    c.saveState()
+    c.translate(x, y)
+    c.doForm(frame)
+    c.restoreState()
+
+    # Values only; the frame form carries the border, grid and header.
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica", geometry.number_font_size)
 
     for row in range(5):
         for col in range(5):
-            cx = inner_x + (col + 0.5) * col_w
-            cy = grid_y + (4 - row + 0.5) * cell_h
+            cx, cy = geometry.cell_centres[row * 5 + col]
             if free_center and row == 2 and col == 2:
-                c.setFont("Helvetica-Bold", max(7, min(14, cell_h * 0.3)))
-                c.drawCentredString(cx, cy, free_center_text)
-                c.setFont("Helvetica", max(8, min(18, cell_h * 0.4)))
+                c.setFont("Helvetica-Bold", geometry.free_font_size)
+                c.drawCentredString(x + cx, y + cy, free_center_text)
+                c.setFont("Helvetica", geometry.number_font_size)
             else:
                 value = card[row][col]
-                c.drawCentredString(cx, cy, str(value))
+                c.drawCentredString(x + cx, y + cy, str(value))
 
+    if serial is not None:
+        sx, sy = geometry.serial_anchor
+        c.setFont("Helvetica", geometry.serial_font_size)
+        c.drawRightString(x + sx, y + sy, serial)
 
-def generate_pdf(
+
+def _paper_size(config: Config) -> Tuple[float, float]:
+    return PAPER_SIZES[config.paper_size]
+
+
+def _card_batches(
     config: Config,
-    warning_handler: Optional[Callable[[str], bool]] = None,
-) -> None:
-    rng = random.Random(config.seed)
-    paper_size = A4 if config.paper_size == "a4" else LETTER
-    page_w, page_h = paper_size
-
-    if config.letter_color_mode == "black":
-        letter_colors = {letter: colors.black for letter in LETTERS}
-    elif config.letter_color_mode == "random":
-        # Start from recognizable colorfulness, then randomize shades.
-        letter_colors = {letter: parse_hex_color(hex_code) for letter, hex_code in PRESET_COLORFUL.items()}
-        letter_colors.update(random_letter_colors(rng))
-    else:
-        letter_colors = parse_custom_letter_colors(config.custom_letter_colors)
+    cards: CardSequence,
+    card_index: Union[UniqueCardIndex, OverlapIndex, None],
+) -> Iterator[CardBatch]:
+    """Yield the run's cards in page-aligned batches of ``PAGES_PER_CHUNK`` pages."""
+    first = config.first_card - 1
+    end = first + config.sheets
+    chunk_size = PAGES_PER_CHUNK * config.sheets_per_page
+    # Duplicates and overlaps are judged against every earlier card, so a
+    # screened run that starts mid-sequence replays the cards before it
+    # without drawing them.
+    start = 0 if card_index is not None else first
+    while start < end:
+        stop = min(start + chunk_size, end if start >= first else first)
+        batch = cards.batch(start, stop - start)
+        if card_index is not None:
+            batch_start = start
+            card_index.add_batch(batch, lambda pos, attempt: cards.variant(batch_start + pos, attempt))
+        if start >= first:
+            yield batch
+        start = stop
+
+
+def _card_sequence(config: Config, segments: List[List[int]], seed: int) -> CardSequence:
+    return CardSequence(
+        seed=seed,
+        min_number=config.min_number,
+        max_number=config.max_number,
+        distribution=config.distribution,
+        segments=segments,
+        free_center=config.free_center,
+    )
 
+
+def collect_cards(config: Config) -> CardBatch:
+    """Regenerate every card of a seeded run as one batch, in card order."""
+    if config.seed is None:
+        raise ValueError("--seed is required to regenerate the cards of a run")
     segments = validate_config(config)
+    batches = list(_card_batches(config, _card_sequence(config, segments, config.seed), _card_index(config)))
+    return CardBatch.concat(batches, config.min_number)
 
-    for warning in collect_warnings(config):
-        if warning_handler is not None:
-            approved = warning_handler(warning)
-            if not approved:
-                raise ValueError("Generation canceled by user")
-        else:
-            confirm_or_exit(warning, config.assume_yes)
 
-    pdf = canvas.Canvas(config.output, pagesize=paper_size)
-    cols, rows = choose_grid(config.sheets_per_page, page_w, page_h)
+@dataclass
+class ArchiveHeader:
+    cell_bytes: int
+    distribution: str
+    free_center: bool
+    unique: bool
+    min_number: int
+    max_number: int
+    first_card: int
+    count: int
+    seed: int
+
+
+def _archive_header(config: Config, seed: int) -> ArchiveHeader:
+    span = config.max_number - config.min_number + 1
+    return ArchiveHeader(
+        cell_bytes=array(_cell_typecode(span)).itemsize,
+        distribution=config.distribution,
+        free_center=config.free_center,
+        unique=config.unique,
+        min_number=config.min_number,
+        max_number=config.max_number,
+        first_card=config.first_card,
+        count=config.sheets,
+        seed=seed,
+    )
 
-    margin = 8 * mm
-    gap = 4 * mm
-    usable_w = page_w - 2 * margin - (cols - 1) * gap
-    usable_h = page_h - 2 * margin - (rows - 1) * gap
-    card_w = usable_w / cols
-    card_h = usable_h / rows
 
-    for sheet_idx in range(config.sheets):
-        idx_on_page = sheet_idx % config.sheets_per_page
-        if idx_on_page == 0 and sheet_idx > 0:
-            pdf.showPage()
+def _pack_archive_header(header: ArchiveHeader) -> bytes:
+    return _ARCHIVE_HEADER.pack(
+        ARCHIVE_MAGIC,
+        ARCHIVE_VERSION,
+        header.cell_bytes,
+        DISTRIBUTIONS.index(header.distribution),
+        header.free_center,
+        header.unique,
+        header.min_number,
+        header.max_number,
+        header.first_card,
+        header.count,
+        header.seed.to_bytes(16, "little", signed=True),
+    )
 
-        row = idx_on_page // cols
-        col = idx_on_page % cols
 
-        x = margin + col * (card_w + gap)
-        y_top = page_h - margin - row * (card_h + gap)
-        y = y_top - card_h
-
-        card = generate_card(
-            rng=rng,
-            min_number=config.min_number,
-            max_number=config.max_number,
-            distribution=config.distribution,
-            segments=segments,
-            free_center=config.free_center,
+def read_archive_header(path: str) -> ArchiveHeader:
+    with open(path, "rb") as handle:
+        raw = handle.read(_ARCHIVE_HEADER.size)
+    if len(raw) < _ARCHIVE_HEADER.size:
+        raise ValueError(f"'{path}' is not a bingo card archive")
+    magic, version, cell_bytes, distribution, free_center, unique, min_number, max_number, first_card, count, seed = (
+        _ARCHIVE_HEADER.unpack(raw)
+    )
+    if magic != ARCHIVE_MAGIC:
+        raise ValueError(f"'{path}' is not a bingo card archive")
+    if version != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported card archive version {version} in '{path}'")
+    return ArchiveHeader(
+        cell_bytes=cell_bytes,
+        distribution=DISTRIBUTIONS[distribution],
+        free_center=bool(free_center),
+        unique=bool(unique),
+        min_number=min_number,
+        max_number=max_number,
+        first_card=first_card,
+        count=count,
+        seed=int.from_bytes(seed, "little", signed=True),
+    )
+
+
+def load_archive(path: str) -> Tuple[ArchiveHeader, CardBatch]:
+    """Open a card archive without parsing it: cells are memory-mapped when NumPy is available."""
+    header = read_archive_header(path)
+    expected = _ARCHIVE_HEADER.size + header.count * 25 * header.cell_bytes
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"Card archive '{path}' is truncated or corrupt")
+    if load_numpy() is not None and header.count > 0:
+        cells = np.memmap(
+            path,
+            dtype=f"<u{header.cell_bytes}",
+            mode="r",
+            offset=_ARCHIVE_HEADER.size,
+            shape=(header.count, 5, 5),
+        )
+    else:
+        cells = array({1: "B", 2: "H", 4: "I"}[header.cell_bytes])
+        with open(path, "rb") as handle:
+            handle.seek(_ARCHIVE_HEADER.size)
+            cells.frombytes(handle.read())
+        if sys.byteorder == "big":
+            cells.byteswap()
+    return header, CardBatch(
+        cells=cells, count=header.count, min_number=header.min_number, start=header.first_card - 1
+    )
+
+
+def _archived(
+    batches: Iterable[CardBatch],
+    path: str,
+    header: ArchiveHeader,
+    skipped: Iterable[CardBatch] = (),
+) -> Iterator[CardBatch]:
+    """Pass batches through unchanged while appending them to a card archive.
+
+    ``skipped`` batches are archived first but not passed on; a resumed run uses
+    them for the cards its earlier attempt already rendered.
+    """
+    with open(path, "wb") as handle:
+        handle.write(_pack_archive_header(header))
+        for batch in skipped:
+            handle.write(batch.to_bytes(header.cell_bytes))
+        for batch in batches:
+            handle.write(batch.to_bytes(header.cell_bytes))
+            yield batch
+
+
+@dataclass
+class SerialRecord:
+    serial: str
+    card_number: int
+    page: int
+    slot: int
+    card: List[List[Optional[int]]]
+
+
+def serial_index_path(output: str) -> str:
+    return numbered_path(output, None, 0, "_serials.idx")
+
+
+def _serial_indexed(
+    batches: Iterable[CardBatch],
+    path: str,
+    config: Config,
+    skipped: Iterable[CardBatch] = (),
+) -> Iterator[CardBatch]:
+    """Pass batches through unchanged while writing one serial index record per card.
+
+    The index is a JSON header line followed by fixed-width text records (serial,
+    page, slot and the 25 cells, ``*`` for the free center), so any serial's
+    record is found with a single seek. ``skipped`` works as in _archived.
+    """
+    prefix = config.serial_prefix or ""
+    total_pages = math.ceil(config.sheets / config.sheets_per_page)
+    serial_width = len(format_serial(config.first_card + config.sheets - 1, prefix))
+    page_width = len(str(total_pages))
+    slot_width = len(str(config.sheets_per_page))
+    cell_width = max(len(str(config.min_number)), len(str(config.max_number)))
+    # Indexed by cell offset; offset 0 is the free center.
+    cell_text = [f"{'*':>{cell_width}}"] + [
+        f"{number:>{cell_width}}" for number in range(config.min_number, config.max_number + 1)
+    ]
+    header = {
+        "format": SERIAL_INDEX_FORMAT,
+        "version": SERIAL_INDEX_VERSION,
+        "prefix": prefix,
+        "first_card": config.first_card,
+        "cards": config.sheets,
+        "sheets_per_page": config.sheets_per_page,
+        # Serial, page, slot and 25 cells, separated by spaces and ended by a newline.
+        "record_bytes": serial_width + page_width + slot_width + 25 * cell_width + 28,
+    }
+
+    def records(batch: CardBatch) -> str:
+        lines = []
+        for position in range(len(batch)):
+            card_number = batch.start + position + 1
+            page, slot = divmod(card_number - config.first_card, config.sheets_per_page)
+            cells = " ".join([cell_text[offset] for offset in batch.card_offsets(position)])
+            lines.append(
+                f"{format_serial(card_number, prefix):<{serial_width}} "
+                f"{page + 1:>{page_width}} {slot + 1:>{slot_width}} {cells}\n"
+            )
+        return "".join(lines)
+
+    # A fixed "\n" keeps records the same width on every platform.
+    with open(path, "w", encoding="ascii", newline="\n") as handle:
+        handle.write(json.dumps(header) + "\n")
+        for batch in skipped:
+            handle.write(records(batch))
+        for batch in batches:
+            handle.write(records(batch))
+            yield batch
+
+
+def lookup_serial(path: str, serial: str) -> SerialRecord:
+    """Find a card in a serial index by reading its header and the one record of ``serial``."""
+    prefix, card_number = parse_serial(serial)
+    try:
+        with open(path, "rb") as handle:
+            header_line = handle.readline()
+            try:
+                header = json.loads(header_line)
+            except ValueError:
+                header = None
+            if not isinstance(header, dict) or header.get("format") != SERIAL_INDEX_FORMAT:
+                raise ValueError(f"'{path}' is not a serial index")
+            if header.get("version") != SERIAL_INDEX_VERSION:
+                raise ValueError(f"Unsupported serial index version {header.get('version')} in '{path}'")
+            if prefix != header["prefix"]:
+                raise ValueError(f"Serial {serial} is not from this event (prefix '{header['prefix']}')")
+            index = card_number - header["first_card"]
+            if not 0 <= index < header["cards"]:
+                raise ValueError(f"Serial {serial} is not part of this run")
+            handle.seek(len(header_line) + index * header["record_bytes"])
+            fields = handle.read(header["record_bytes"]).decode("ascii").split()
+    except OSError as err:
+        raise ValueError(f"Cannot read serial index '{path}': {err.strerror}") from err
+    if len(fields) != 28:
+        raise ValueError(f"Serial index '{path}' is truncated or corrupt")
+    values = [None if field == "*" else int(field) for field in fields[3:]]
+    return SerialRecord(
+        serial=fields[0],
+        card_number=card_number,
+        page=int(fields[1]),
+        slot=int(fields[2]),
+        card=[values[row * 5 : row * 5 + 5] for row in range(5)],
+    )
+
+
+def _render_cards(
+    pdf: canvas.Canvas,
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Draw cards onto consecutive pages of ``pdf``, starting with its first page.
+
+    ``on_page`` is called with the card count of every page once it is drawn.
+    """
+    layout = page_layout(config.paper_size, config.sheets_per_page)
+    card_w, card_h = layout.card.width, layout.card.height
+    frame = card_frame_form(pdf, card_w, card_h, letter_colors)
+
+    prefix = config.serial_prefix
+    sheet_idx = 0
+    for batch in batches:
+        for position, card in enumerate(batch):
+            idx_on_page = sheet_idx % config.sheets_per_page
+            if idx_on_page == 0 and sheet_idx > 0:
+                pdf.showPage()
+
+            x, y = layout.slots[idx_on_page]
+            draw_card(
+                pdf,
+                x,
+                y,
+                card_w,
+                card_h,
+                card,
+                letter_colors,
+                free_center=config.free_center,
+                free_center_text=config.free_center_text,
+                frame=frame,
+                serial=None if prefix is None else format_serial(batch.start + position + 1, prefix),
+            )
+            sheet_idx += 1
+            if on_page is not None and idx_on_page == config.sheets_per_page - 1:
+                on_page(config.sheets_per_page)
+    if on_page is not None and sheet_idx % config.sheets_per_page:
+        on_page(sheet_idx % config.sheets_per_page)
+
+
+def _centred_text(font: str, size: float, cx: float, cy: float, text: str) -> bytes:
+    x = cx - stringWidth(text, font, size) / 2.0
+    return f"1 0 0 1 {pdf_number(x)} {pdf_number(cy)} Tm ".encode("ascii") + pdf_string(text) + b" Tj\n"
+
+
+def _right_text(font: str, size: float, rx: float, y: float, text: str) -> bytes:
+    x = rx - stringWidth(text, font, size)
+    return f"1 0 0 1 {pdf_number(x)} {pdf_number(y)} Tm ".encode("ascii") + pdf_string(text) + b" Tj\n"
+
+
+def _frame_operators(
+    geometry: CardGeometry,
+    letter_colors: Dict[str, colors.Color],
+    bold_font: str,
+) -> bytes:
+    """PDF operators for the same static card frame that card_frame_form draws."""
+    ops = [f"0 G 1 w 0 0 {pdf_number(geometry.width)} {pdf_number(geometry.height)} re S\n".encode("ascii")]
+
+    ops.append(f"BT /{bold_font} {pdf_number(geometry.header_font_size)} Tf\n".encode("ascii"))
+    for letter, (cx, cy) in zip(LETTERS, geometry.header_centres):
+        color = letter_colors.get(letter, colors.black)
+        ops.append(f"{color.red:.3f} {color.green:.3f} {color.blue:.3f} rg\n".encode("ascii"))
+        ops.append(_centred_text("Helvetica-Bold", geometry.header_font_size, cx, cy, letter))
+    ops.append(b"ET\n")
+
+    for x1, y1, x2, y2 in geometry.grid_lines:
+        ops.append(
+            f"{pdf_number(x1)} {pdf_number(y1)} m {pdf_number(x2)} {pdf_number(y2)} l S\n".encode("ascii")
         )
-        draw_card(
-            pdf,
-            x,
-            y,
-            card_w,
-            card_h,
-            card,
-            letter_colors,
-            free_center=config.free_center,
-            free_center_text=config.free_center_text,
+    return b"".join(ops)
+
+
+def _render_direct(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Write PDF content streams directly, bypassing the ReportLab canvas.
+
+    Produces the same drawing as draw_card using the standard Helvetica fonts.
+    Every card is drawn in its own coordinate system, so the operators showing
+    a given number in a given cell are identical on every card; they are built
+    once and reused. Pages go to disk as soon as they are complete, keeping
+    memory flat for any run size.
+    """
+    _require_reportlab()
+    layout = page_layout(config.paper_size, config.sheets_per_page)
+    geometry = layout.card
+    number_size = geometry.number_font_size
+    free_size = geometry.free_font_size
+    centres = geometry.cell_centres
+
+    writer = StreamingPdfWriter(config.output, layout.page_size)
+    try:
+        number_font = writer.add_standard_font("Helvetica")
+        bold_font = writer.add_standard_font("Helvetica-Bold")
+        frame = writer.add_form(
+            _frame_operators(geometry, letter_colors, bold_font),
+            bbox=(-1, -1, geometry.width + 1, geometry.height + 1),
+        )
+        number_font_op = f"/{number_font} {pdf_number(number_size)} Tf\n".encode("ascii")
+        card_start = [
+            f"q 1 0 0 1 {pdf_number(x)} {pdf_number(y)} cm /{frame} Do 0 g BT ".encode("ascii") + number_font_op
+            for x, y in layout.slots
+        ]
+        # Keyed by offset * 25 + cell; offset 0 is the free center.
+        text_ops: Dict[int, bytes] = {
+            12: f"/{bold_font} {pdf_number(free_size)} Tf\n".encode("ascii")
+            + _centred_text("Helvetica-Bold", free_size, *centres[12], config.free_center_text)
+            + number_font_op
+        }
+
+        def text_op(key: int) -> bytes:
+            offset, cell = divmod(key, 25)
+            op = _centred_text("Helvetica", number_size, *centres[cell], str(offset + config.min_number - 1))
+            if len(text_ops) < TEXT_CACHE_LIMIT:
+                text_ops[key] = op
+            return op
+
+        prefix = config.serial_prefix
+        serial_font_op = f"/{number_font} {pdf_number(geometry.serial_font_size)} Tf\n".encode("ascii")
+        page: List[bytes] = []
+        idx_on_page = 0
+        for batch in batches:
+            for position, keys in enumerate(batch.cell_keys()):
+                page.append(card_start[idx_on_page])
+                page.extend([text_ops.get(key) or text_op(key) for key in keys])
+                if prefix is not None:
+                    serial = format_serial(batch.start + position + 1, prefix)
+                    page.append(
+                        serial_font_op
+                        + _right_text("Helvetica", geometry.serial_font_size, *geometry.serial_anchor, serial)
+                    )
+                page.append(b"ET Q\n")
+                idx_on_page += 1
+                if idx_on_page == config.sheets_per_page:
+                    writer.add_page(b"".join(page))
+                    page = []
+                    idx_on_page = 0
+                    if on_page is not None:
+                        on_page(config.sheets_per_page)
+        if page:
+            writer.add_page(b"".join(page))
+            if on_page is not None:
+                on_page(idx_on_page)
+        with _phase("save"):
+            writer.close()
+    except BaseException:
+        writer.abort()
+        os.remove(config.output)
+        raise
+
+
+def numbered_path(output: str, number: Optional[int], total: int, suffix: str) -> str:
+    """``output`` with its extension replaced by a zero-padded ``_NNNN`` number and ``suffix``.
+
+    With ``number`` None only the suffix replaces the extension.
+    """
+    stem = os.path.splitext(output)[0]
+    if number is None:
+        return stem + suffix
+    return f"{stem}_{number:0{max(4, len(str(total)))}d}{suffix}"
+
+
+def svg_page_path(output: str, page: int, total_pages: int) -> str:
+    """Path of 1-based ``page`` when a run is written as one SVG file per page."""
+    return numbered_path(output, page, total_pages, ".svg")
+
+
+def _svg_frame(geometry: CardGeometry, letter_colors: Dict[str, colors.Color]) -> str:
+    """The static card frame as an SVG group, drawn once per file and placed with <use>."""
+    h = geometry.height
+    lines = "".join(
+        f"M{pdf_number(x1)} {pdf_number(h - y1)}L{pdf_number(x2)} {pdf_number(h - y2)}"
+        for x1, y1, x2, y2 in geometry.grid_lines
+    )
+    letters = "".join(
+        f'<text x="{pdf_number(cx)}" y="{pdf_number(h - cy)}" fill="#{letter_colors.get(letter, colors.black).hexval()[2:]}">'
+        f"{letter}</text>"
+        for letter, (cx, cy) in zip(LETTERS, geometry.header_centres)
+    )
+    return (
+        f'<g id="frame"><rect width="{pdf_number(geometry.width)}" height="{pdf_number(h)}" '
+        f'fill="none" stroke="#000"/><path d="{lines}" stroke="#000"/>'
+        f'<g font-weight="bold" font-size="{pdf_number(geometry.header_font_size)}">{letters}</g></g>'
+    )
+
+
+def _render_svg(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Write one standalone SVG file per page, each written as soon as its cards are known.
+
+    The frame is defined once per file under <defs> and every card places it
+    with <use>, so cards only add their numbers. Text for a given number in a
+    given cell is the same on every card and is built once, as in the fast PDF
+    backend.
+    """
+    from xml.sax.saxutils import escape as xml_escape
+
+    _require_reportlab()
+    layout = page_layout(config.paper_size, config.sheets_per_page)
+    geometry = layout.card
+    page_w, page_h = layout.page_size
+    card_h = geometry.height
+    total_pages = math.ceil(config.sheets / config.sheets_per_page)
+
+    header = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{pdf_number(page_w)}pt" height="{pdf_number(page_h)}pt" '
+        f'viewBox="0 0 {pdf_number(page_w)} {pdf_number(page_h)}">\n'
+        f"<defs>{_svg_frame(geometry, letter_colors)}</defs>\n"
+        '<g font-family="Helvetica, Arial, sans-serif" text-anchor="middle" '
+        f'font-size="{pdf_number(geometry.number_font_size)}">\n'
+    )
+    footer = "</g>\n</svg>\n"
+    card_start = [
+        f'<g transform="translate({pdf_number(x)} {pdf_number(page_h - y - card_h)})"><use xlink:href="#frame"/>'
+        for x, y in layout.slots
+    ]
+    centres = [(pdf_number(cx), pdf_number(card_h - cy)) for cx, cy in geometry.cell_centres]
+    # Keyed by offset * 25 + cell; offset 0 is the free center.
+    texts: Dict[int, str] = {
+        12: (
+            f'<text x="{centres[12][0]}" y="{centres[12][1]}" font-weight="bold" '
+            f'font-size="{pdf_number(geometry.free_font_size)}">{xml_escape(config.free_center_text)}</text>'
+        )
+    }
+
+    def text(key: int) -> str:
+        offset, cell = divmod(key, 25)
+        element = f'<text x="{centres[cell][0]}" y="{centres[cell][1]}">{offset + config.min_number - 1}</text>'
+        if len(texts) < TEXT_CACHE_LIMIT:
+            texts[key] = element
+        return element
+
+    serial_x, serial_y = geometry.serial_anchor
+    serial_start = (
+        f'<text x="{pdf_number(serial_x)}" y="{pdf_number(card_h - serial_y)}" text-anchor="end" '
+        f'font-size="{pdf_number(geometry.serial_font_size)}">'
+    )
+
+    def serial(card_number: int) -> str:
+        if config.serial_prefix is None:
+            return ""
+        return serial_start + format_serial(card_number, config.serial_prefix) + "</text>"
+
+    written: List[str] = []
+
+    def write_page(cards: List[str]) -> None:
+        path = svg_page_path(config.output, len(written) + 1, total_pages)
+        written.append(path)
+        with _phase("save"), open(path, "w", encoding="utf-8") as handle:
+            handle.write(header)
+            handle.write("".join(cards))
+            handle.write(footer)
+        if on_page is not None:
+            on_page(len(cards))
+
+    try:
+        page: List[str] = []
+        for batch in batches:
+            for position, keys in enumerate(batch.cell_keys()):
+                numbers = "".join([texts.get(key) or text(key) for key in keys])
+                page.append(card_start[len(page)] + numbers + serial(batch.start + position + 1) + "</g>\n")
+                if len(page) == config.sheets_per_page:
+                    write_page(page)
+                    page = []
+        if page:
+            write_page(page)
+    except BaseException:
+        for path in written:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+
+def _peak_memory_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file's contents, or None when it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class _Checkpoint:
+    """The finished shard files of a resumable run, saved after each one.
+
+    Cards depend only on the seed and their card number, so a rerun regenerates
+    the rest of the run from the first card after the last finished shard.
+    """
+
+    def __init__(self, config: Config, seed: int) -> None:
+        self.path = numbered_path(config.output, None, 0, "_checkpoint.json")
+        self.directory = os.path.dirname(os.path.abspath(self.path))
+        self.seed = seed
+        self.options = {name: getattr(config, name) for name in CHECKPOINT_OPTIONS}
+        self.completed: List[Dict[str, Any]] = []
+
+    @classmethod
+    def open(cls, config: Config) -> _Checkpoint:
+        """Load the run's checkpoint, or start and save a new one when there is none.
+
+        Recorded shards are kept up to the first one that is missing or changed
+        on disk; that one and everything after it are rendered again.
+        """
+        path = numbered_path(config.output, None, 0, "_checkpoint.json")
+        if not os.path.exists(path):
+            seed = config.seed if config.seed is not None else random.SystemRandom().getrandbits(63)
+            checkpoint = cls(config, seed)
+            checkpoint.save()
+            return checkpoint
+
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            version, seed, options, completed = data["version"], data["seed"], data["options"], data["completed"]
+        except OSError as err:
+            raise ValueError(f"Cannot read checkpoint {path}: {err.strerror}") from err
+        except (json.JSONDecodeError, KeyError, TypeError) as err:
+            raise ValueError(f"Checkpoint {path} is not valid; delete it to start over") from err
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint {path} has unsupported version {version}; delete it to start over")
+        if config.seed is not None and config.seed != seed:
+            raise ValueError(f"Checkpoint {path} was written for seed {seed}, not {config.seed}")
+        checkpoint = cls(config, seed)
+        changed = [name for name in CHECKPOINT_OPTIONS if options.get(name) != checkpoint.options[name]]
+        if changed:
+            raise ValueError(
+                f"Checkpoint {path} was written with different {', '.join(changed)}; delete it to start over"
+            )
+        for entry in completed:
+            if _file_digest(os.path.join(checkpoint.directory, entry["file"])) != entry["sha256"]:
+                break
+            checkpoint.completed.append(entry)
+        return checkpoint
+
+    @property
+    def cards(self) -> int:
+        return sum(entry["cards"] for entry in self.completed)
+
+    def paths(self) -> List[str]:
+        return [os.path.join(self.directory, entry["file"]) for entry in self.completed]
+
+    def add(self, path: str, cards: int) -> None:
+        self.completed.append(
+            {"file": os.path.relpath(path, self.directory), "cards": cards, "sha256": _file_digest(path)}
+        )
+        self.save()
+
+    def save(self) -> None:
+        # Replace the file in one step so a crash mid-write never loses the previous checkpoint.
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "seed": self.seed,
+                    "options": self.options,
+                    "completed": self.completed,
+                },
+                handle,
+                indent=2,
+            )
+            handle.write("\n")
+        os.replace(temp_path, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _render_shard(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batch: CardBatch,
+    path: str,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> str:
+    _render_file(replace(config, output=path), letter_colors, [batch], on_page)
+    return path
+
+
+def _run_in_pool(
+    workers: int,
+    func: Callable[..., Any],
+    tasks: Iterable[Tuple[tuple, int]],
+    on_done: Callable[[Any, int], None],
+) -> None:
+    """Call ``func(*args)`` for every (args, cards) task in a process pool.
+
+    ``on_done(result, cards)`` runs in this process in task order. At most
+    ``2 * workers`` tasks are in flight, so card batches are never all held at once.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Tuple[Future, int]] = deque()
+        try:
+            for args, cards in tasks:
+                pending.append((pool.submit(func, *args), cards))
+                while len(pending) >= 2 * workers:
+                    future, done = pending.popleft()
+                    on_done(future.result(), done)
+            while pending:
+                future, done = pending.popleft()
+                on_done(future.result(), done)
+        except BaseException:
+            for future, _cards in pending:
+                future.cancel()
+            raise
+
+
+def _report_pages(on_page: Optional[Callable[[int], None]], cards: int, sheets_per_page: int) -> None:
+    """Report a block of pages rendered elsewhere; other processes cannot call on_page."""
+    if on_page is not None:
+        for start in range(0, cards, sheets_per_page):
+            on_page(min(sheets_per_page, cards - start))
+
+
+def _render_shards(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    shard_dir: str,
+    on_page: Optional[Callable[[int], None]] = None,
+    checkpoint: Optional[_Checkpoint] = None,
+) -> List[str]:
+    """Render each page-aligned batch to its own PDF in ``shard_dir`` and return the paths in order.
+
+    Shards a checkpoint already holds are not in ``batches``; numbering continues after them.
+    """
+    workers = config.workers or 1
+    first_index = len(checkpoint.completed) if checkpoint is not None else 0
+    shard_paths: List[str] = []
+
+    def finished(path: str, cards: int) -> None:
+        shard_paths.append(path)
+        if checkpoint is not None:
+            checkpoint.add(path, cards)
+
+    if workers == 1:
+        for index, batch in enumerate(batches, start=first_index):
+            path = os.path.join(shard_dir, f"shard_{index:06d}.pdf")
+            finished(_render_shard(config, letter_colors, batch, path, on_page), len(batch))
+    else:
+
+        def rendered(path: str, cards: int) -> None:
+            _report_pages(on_page, cards, config.sheets_per_page)
+            finished(path, cards)
+
+        tasks = (
+            ((config, letter_colors, batch, os.path.join(shard_dir, f"shard_{index:06d}.pdf")), len(batch))
+            for index, batch in enumerate(batches, start=first_index)
+        )
+        _run_in_pool(workers, _render_shard, tasks, rendered)
+    return shard_paths
+
+
+def _render_sharded(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    on_page: Optional[Callable[[int], None]] = None,
+    checkpoint: Optional[_Checkpoint] = None,
+) -> None:
+    """Render each page-aligned batch to its own PDF in a process pool, then merge in order.
+
+    Shard boundaries depend only on the config, never on the worker count, so a
+    seeded run produces the same file whatever ``--workers`` is set to. It has the
+    same pages as _render_file's single canvas, but not the same bytes. With a
+    checkpoint the shards are kept in ``output.parts`` until the merge succeeds,
+    so an interrupted run can pick them up again.
+    """
+    from pypdf import PdfWriter
+
+    def merge(shard_paths: List[str]) -> None:
+        with _phase("save"):
+            writer = PdfWriter()
+            for path in shard_paths:
+                writer.append(path)
+            with open(config.output, "wb") as handle:
+                writer.write(handle)
+
+    if checkpoint is None:
+        output_dir = os.path.dirname(os.path.abspath(config.output))
+        with tempfile.TemporaryDirectory(prefix=".bingo-shards-", dir=output_dir) as shard_dir:
+            merge(_render_shards(config, letter_colors, batches, shard_dir, on_page))
+        return
+
+    parts_dir = numbered_path(config.output, None, 0, ".parts")
+    os.makedirs(parts_dir, exist_ok=True)
+    done = checkpoint.paths()
+    merge(done + _render_shards(config, letter_colors, batches, parts_dir, on_page, checkpoint))
+    shutil.rmtree(parts_dir)
+
+
+def _render_file(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Write the cards of ``batches`` to ``config.output`` with the backend the config selects."""
+    if config.stream or config.backend == "fast":
+        _render_direct(config, letter_colors, batches, on_page)
+    else:
+        _require_reportlab()
+        # Seeded and resumable runs leave out timestamps so the same cards give the same bytes.
+        invariant = config.seed is not None or config.resume
+        pdf = canvas.Canvas(config.output, pagesize=_paper_size(config), invariant=invariant)
+        _render_cards(pdf, config, letter_colors, batches, on_page)
+        with _phase("save"):
+            pdf.save()
+
+
+def _split_files(
+    config: Config,
+    batches: Iterable[CardBatch],
+    first_index: int = 0,
+) -> Iterator[Tuple[Config, List[CardBatch]]]:
+    """Regroup a run's batches into (file config, batches) of ``max_pages_per_file`` pages each.
+
+    Each file config is a self-contained run of its card range, so files can be
+    rendered independently and in any process. ``batches`` start at file
+    ``first_index`` (0-based) when earlier files are already written.
+    """
+    file_cards = config.max_pages_per_file * config.sheets_per_page
+    total_files = math.ceil(config.sheets / file_cards)
+    parts: List[CardBatch] = []
+    held = 0
+    index = first_index
+
+    def file_config(cards: int) -> Config:
+        return replace(
+            config,
+            output=numbered_path(config.output, index + 1, total_files, ".pdf"),
+            sheets=cards,
+            first_card=config.first_card + index * file_cards,
+            archive=None,
+            workers=None,
+            max_pages_per_file=None,
         )
 
-    pdf.save()
+    for batch in batches:
+        start = 0
+        while start < len(batch):
+            take = min(len(batch) - start, file_cards - held)
+            parts.append(batch if take == len(batch) else batch.subset(start, start + take))
+            held += take
+            start += take
+            if held == file_cards:
+                yield file_config(held), parts
+                parts = []
+                held = 0
+                index += 1
+    if parts:
+        yield file_config(held), parts
+
+
+def _render_files(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: Iterable[CardBatch],
+    seed: int,
+    on_page: Optional[Callable[[int], None]] = None,
+    checkpoint: Optional[_Checkpoint] = None,
+) -> int:
+    """Write the run as numbered PDF files plus a JSON index of their page and card ranges.
+
+    Returns the number of files written. A failed or canceled run removes every
+    file it wrote, except those a checkpoint has recorded for a later resume.
+    """
+    index_path = numbered_path(config.output, None, 0, "_shards.json")
+    first_index = len(checkpoint.completed) if checkpoint is not None else 0
+    written: List[str] = []
+
+    def finished(file_config: Config, cards: int) -> None:
+        if checkpoint is not None:
+            checkpoint.add(file_config.output, cards)
+
+    def tracked(files: Iterator[Tuple[Config, List[CardBatch]]]) -> Iterator[Tuple[Config, List[CardBatch]]]:
+        for file_config, parts in files:
+            written.append(file_config.output)
+            yield file_config, parts
+
+    try:
+        files = tracked(_split_files(config, batches, first_index))
+        if config.workers is None:
+            for file_config, parts in files:
+                _render_file(file_config, letter_colors, parts, on_page)
+                finished(file_config, file_config.sheets)
+        else:
+
+            def rendered(file_config: Config, cards: int) -> None:
+                _report_pages(on_page, cards, config.sheets_per_page)
+                finished(file_config, cards)
+
+            tasks = (((file_config, letter_colors, parts), file_config.sheets) for file_config, parts in files)
+            _run_in_pool(config.workers, _render_file_task, tasks, rendered)
+
+        file_cards = config.max_pages_per_file * config.sheets_per_page
+        total_files = math.ceil(config.sheets / file_cards)
+        entries: List[Dict[str, Any]] = []
+        for index in range(total_files):
+            cards = min(file_cards, config.sheets - index * file_cards)
+            first_card = config.first_card + index * file_cards
+            first_page = index * config.max_pages_per_file + 1
+            entries.append(
+                {
+                    "file": os.path.basename(numbered_path(config.output, index + 1, total_files, ".pdf")),
+                    "first_page": first_page,
+                    "last_page": first_page + math.ceil(cards / config.sheets_per_page) - 1,
+                    "first_card": first_card,
+                    "last_card": first_card + cards - 1,
+                }
+            )
+        with _phase("save"), open(index_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "seed": seed,
+                    "cards": config.sheets,
+                    "sheets_per_page": config.sheets_per_page,
+                    "max_pages_per_file": config.max_pages_per_file,
+                    "files": entries,
+                },
+                handle,
+                indent=2,
+            )
+            handle.write("\n")
+    except BaseException:
+        kept = set(checkpoint.paths()) if checkpoint is not None else set()
+        for path in written + [index_path]:
+            if os.path.abspath(path) not in kept and os.path.exists(path):
+                os.remove(path)
+        raise
+    return len(entries)
+
+
+def _render_file_task(
+    config: Config,
+    letter_colors: Dict[str, colors.Color],
+    batches: List[CardBatch],
+) -> Config:
+    _render_file(config, letter_colors, batches)
+    return config
+
+
+def generate_pdf(
+    config: Config,
+    warning_handler: Optional[Callable[[str], bool]] = None,
+    progress: Optional[Callable[[Progress], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> GenerationStats:
+    """Write the PDF described by ``config`` and return statistics about the run.
+
+    ``progress`` receives a Progress snapshot as pages are drawn, at most once
+    every ``PROGRESS_INTERVAL`` seconds plus once for the final page. ``cancel``
+    is a cooperative token such as ``threading.Event``: once set, the run stops
+    at the next page boundary and raises GenerationCanceled without leaving a
+    partial output or archive file behind. With ``config.resume`` the finished
+    shards are recorded in a checkpoint instead and kept for the next attempt.
+    The returned stats carry the wall time of each of ``TIMING_PHASES``.
+    """
+    clock = _PhaseClock()
+    token = _PHASE_CLOCK.set(clock)
+    try:
+        stats = _generate_pdf(config, warning_handler, progress, cancel, clock)
+    finally:
+        _PHASE_CLOCK.reset(token)
+    stats.timings = {phase: clock.seconds.get(phase, 0.0) for phase in TIMING_PHASES}
+    # Time spent waiting for the user to confirm warnings is not part of the run.
+    stats.seconds = clock.elapsed() - clock.seconds.get("confirm", 0.0)
+    return stats
+
+
+def _generate_pdf(
+    config: Config,
+    warning_handler: Optional[Callable[[str], bool]],
+    progress: Optional[Callable[[Progress], None]],
+    cancel: Optional[threading.Event],
+    clock: _PhaseClock,
+) -> GenerationStats:
+    with clock.phase("validate"):
+        # A missing ReportLab is reported like any other invalid setting.
+        _require_reportlab()
+        segments = validate_config(config)
+        warnings = collect_warnings(config)
+
+    with clock.phase("confirm"):
+        for warning in warnings:
+            if warning_handler is not None:
+                approved = warning_handler(warning)
+                if not approved:
+                    raise ValueError("Generation canceled by user")
+            else:
+                confirm_or_exit(warning, config.assume_yes)
+
+    # Opening the checkpoint checks it against the config, and color options are parsed here.
+    with clock.phase("validate"):
+        checkpoint = _Checkpoint.open(config) if config.resume else None
+        # Resolve a seed up front so every run can be reproduced or partially reprinted.
+        if checkpoint is not None:
+            seed = checkpoint.seed
+        else:
+            seed = config.seed if config.seed is not None else random.SystemRandom().getrandbits(63)
+        rng = random.Random(seed)
+
+        if config.letter_color_mode == "black":
+            letter_colors = {letter: colors.black for letter in LETTERS}
+        elif config.letter_color_mode == "random":
+            # Start from recognizable colorfulness, then randomize shades.
+            letter_colors = {letter: parse_hex_color(hex_code) for letter, hex_code in PRESET_COLORFUL.items()}
+            letter_colors.update(random_letter_colors(rng))
+        else:
+            letter_colors = parse_custom_letter_colors(config.custom_letter_colors)
+
+    stats = GenerationStats()
+    # Building the sampler and the card index (which may import NumPy) is part of generating.
+    with clock.phase("generate"):
+        card_index = _card_index(config)
+        if config.unique:
+            stats.possible_cards = possible_card_count(config, segments)
+        cards = _card_sequence(config, segments, seed)
+    stats.seed = cards.seed
+    # A resumed run restarts card generation at the first card after its finished shards.
+    done = checkpoint.cards if checkpoint is not None else 0
+    stats.resumed_cards = done
+    remaining = replace(config, first_card=config.first_card + done, sheets=config.sheets - done)
+    batches = clock.iterate("generate", _card_batches(remaining, cards, card_index))
+
+    def finished_cards() -> Iterator[CardBatch]:
+        # Archives and indexes still cover the whole run, so finished cards are regenerated for them.
+        return clock.iterate("generate", _card_batches(replace(config, sheets=done), cards, _card_index(config)))
+
+    # (writer generator, path) of every side file, so a failed run can close and remove them.
+    side_files: List[Tuple[Iterator[CardBatch], str]] = []
+    if config.archive:
+        batches = _archived(batches, config.archive, _archive_header(config, seed), finished_cards())
+        side_files.append((batches, config.archive))
+    if config.serial_prefix is not None:
+        index_path = serial_index_path(config.output)
+        batches = _serial_indexed(batches, index_path, config, finished_cards())
+        side_files.append((batches, index_path))
+    if side_files:
+        # Writing archives and serial indexes counts as saving; the cards they pull in still count as generating.
+        batches = clock.iterate("save", batches)
+    total_pages = math.ceil(config.sheets / config.sheets_per_page)
+    on_page: Optional[Callable[[int], None]] = None
+    if progress is not None or cancel is not None:
+        resumed_pages = math.ceil(done / config.sheets_per_page)
+        on_page = _ProgressReporter(config.sheets, total_pages, progress, cancel, done, resumed_pages).page_done
+
+    try:
+        with clock.phase("draw"):
+            if config.format == "svg":
+                _render_svg(config, letter_colors, batches, on_page)
+            elif config.max_pages_per_file is not None:
+                stats.files = _render_files(config, letter_colors, batches, seed, on_page, checkpoint)
+            elif config.workers is None and checkpoint is None:
+                _render_file(config, letter_colors, batches, on_page)
+            else:
+                _render_sharded(config, letter_colors, batches, on_page, checkpoint)
+        if checkpoint is not None:
+            checkpoint.remove()
+    except BaseException:
+        # Close side files before removing them; an open file cannot be deleted on Windows.
+        for writer, path in reversed(side_files):
+            writer.close()
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    stats.cards = config.sheets
+    stats.pages = total_pages
+    if isinstance(card_index, UniqueCardIndex):
+        stats.unique_collisions = card_index.collisions
+    elif isinstance(card_index, OverlapIndex):
+        stats.max_overlap = card_index.max_overlap
+        stats.overlap_rejections = card_index.rejections
+        stats.overlap_seconds = card_index.seconds
+    stats.peak_memory_mb = _peak_memory_mb()
+    return stats
+
+
+def _profiled(path: str, func: Callable[..., _T], *args: Any) -> _T:
+    """Call ``func(*args)`` under cProfile and write the stats to ``path``, even if the call fails."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        profiler.dump_stats(path)
+        print(f"Profile: {path} (inspect with: python3 -m pstats {path})", file=sys.stderr)
 
 
 def main(argv: Sequence[str]) -> int:
+    if argv and argv[0] == "bench":
+        from bingo_bench import main as bench_main
+
+        return bench_main(argv[1:])
+    if argv and argv[0] == "serve":
+        from bingo_serve import main as serve_main
+
+        return serve_main(argv[1:])
+    if argv and argv[0] == "simulate":
+        from bingo_simulate import main as simulate_main
+
+        return simulate_main(argv[1:])
+
     try:
-        config = parse_args(argv)
-        generate_pdf(config)
+        args = build_parser().parse_args(argv)
+        config = config_from_args(args)
+        if args.manifest:
+            from bingo_manifest import run_manifest_command
+
+            run = functools.partial(
+                run_manifest_command,
+                args.manifest,
+                config,
+                args.parallel_jobs,
+                validate_only=args.validate_only,
+                timings=args.timings,
+            )
+            return _profiled(args.profile, run) if args.profile else run()
+        if args.validate_only:
+            validate_config(config)
+            for warning in collect_warnings(config):
+                print(f"WARNING: {warning}")
+            print("Configuration is valid.")
+            return 0
+        stats = _profiled(args.profile, generate_pdf, config) if args.profile else generate_pdf(config)
     except ValueError as err:
         print(f"Error: {err}", file=sys.stderr)
         return 2
@@ -449,7 +2656,46 @@ def main(argv: Sequence[str]) -> int:
         print("Interrupted.", file=sys.stderr)
         return 130
 
-    print(f"Generated: {config.output}")
+    if config.format == "svg":
+        print(
+            f"Generated: {stats.pages} SVG page(s), {svg_page_path(config.output, 1, stats.pages)} "
+            f"to {svg_page_path(config.output, stats.pages, stats.pages)}"
+        )
+    elif config.max_pages_per_file is not None:
+        print(
+            f"Generated: {stats.files} PDF file(s), {numbered_path(config.output, 1, stats.files, '.pdf')} "
+            f"to {numbered_path(config.output, stats.files, stats.files, '.pdf')}"
+        )
+        print(f"Shard index: {numbered_path(config.output, None, 0, '_shards.json')}")
+    else:
+        print(f"Generated: {config.output}")
+    if config.serial_prefix is not None:
+        print(f"Serial index: {serial_index_path(config.output)}")
+    if stats.resumed_cards:
+        print(f"Resumed: {stats.resumed_cards} card(s) from earlier attempts were kept")
+    if config.stream and stats.peak_memory_mb is not None:
+        print(f"Peak memory: {stats.peak_memory_mb:.1f} MB")
+    if config.seed is None:
+        print(f"Seed: {stats.seed} (pass --seed {stats.seed} to reprint any card from this run)")
+    if config.unique:
+        used = stats.cards / stats.possible_cards if stats.possible_cards else 0.0
+        print(
+            f"Unique cards: {stats.cards} ({stats.unique_collisions} duplicate(s) regenerated, "
+            f"{used * 100:.4g}% of {stats.possible_cards} possible cards used)"
+        )
+    if stats.max_overlap is not None:
+        print(
+            f"Max shared numbers: {stats.max_overlap} of {config.max_shared} allowed "
+            f"({stats.overlap_rejections} card(s) redrawn, {stats.overlap_seconds:.2f}s checking overlaps)"
+        )
+    if args.timings:
+        print("Timings:")
+        for phase, seconds in stats.timings.items():
+            print(f"  {phase:<9} {seconds:8.3f}s")
+        print(
+            f"  {'total':<9} {stats.seconds:8.3f}s  "
+            f"({stats.cards_per_second:,.0f} cards/s, {stats.pages_per_second:,.0f} pages/s)"
+        )
     return 0
 
 
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import locale
 import os
+import queue
 import sys
-from typing import Dict, Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 try:
     import tkinter as tk
@@ -22,7 +24,18 @@ except ModuleNotFoundError:
     )
     raise SystemExit(1)
 
-from bingo_generator import Config, generate_pdf
+from bingo_generator import (
+    Config,
+    GenerationCanceled,
+    GenerationStats,
+    Progress,
+    collect_warnings,
+    generate_pdf,
+    validate_config,
+)
+
+# How often the UI thread checks the worker thread for progress, in milliseconds.
+POLL_INTERVAL_MS = 100
 
 TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "en": {
@@ -47,6 +60,10 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generate_pdf": "Generate PDF",
         "ready": "Ready",
         "generating": "Generating PDF...",
+        "generating_pages": "Generating PDF... page {page} of {pages}, about {eta} left",
+        "cancel": "Cancel",
+        "canceling": "Canceling...",
+        "canceled": "Generation canceled",
         "tip": "Tip: Use segmented for classic B-I-N-G-O ranges. Warnings will ask for confirmation before generating.",
         "browse": "Browse...",
         "save_pdf": "Save Bingo PDF",
@@ -60,6 +77,13 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generated": "Generated: {path}",
         "done": "Done",
         "generated_message": "Bingo PDF generated:\n{path}",
+        "timings": "Timings",
+        "phase_validate": "Validate",
+        "phase_generate": "Generate cards",
+        "phase_draw": "Draw",
+        "phase_save": "Save",
+        "phase_total": "Total",
+        "throughput": "{cards} cards/s, {pages} pages/s",
         "field_required": "{field} is required",
         "dist_segmented": "Segmented",
         "dist_fully-random": "Fully random",
@@ -89,6 +113,10 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generate_pdf": "Luo PDF",
         "ready": "Valmis",
         "generating": "Luodaan PDF...",
+        "generating_pages": "Luodaan PDF... sivu {page}/{pages}, noin {eta} jäljellä",
+        "cancel": "Peruuta",
+        "canceling": "Peruutetaan...",
+        "canceled": "Luonti peruutettu",
         "tip": "Vinkki: segmented vastaa klassista B-I-N-G-O-jakoa. Varoituksissa pyydetään vahvistus ennen luontia.",
         "browse": "Selaa...",
         "save_pdf": "Tallenna bingo-PDF",
@@ -102,6 +130,13 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generated": "Luotu: {path}",
         "done": "Valmis",
         "generated_message": "Bingo-PDF luotu:\n{path}",
+        "timings": "Vaiheiden kestot",
+        "phase_validate": "Tarkistus",
+        "phase_generate": "Lappujen luonti",
+        "phase_draw": "Piirto",
+        "phase_save": "Tallennus",
+        "phase_total": "Yhteensä",
+        "throughput": "{cards} lappua/s, {pages} sivua/s",
         "field_required": "Kenttä '{field}' on pakollinen",
         "dist_segmented": "Segmentoitu",
         "dist_fully-random": "Täysin satunnainen",
@@ -161,7 +196,11 @@ class BingoGui(tk.Tk):
         self.free_center_text = tk.StringVar(value="FREE")
         self.seed = tk.StringVar(value="")
         self.status = tk.StringVar(value=self.tr("ready"))
+        self.progress = tk.DoubleVar(value=0.0)
         self._root_frame: Optional[ttk.Frame] = None
+        self._worker: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._events: queue.Queue[Tuple] = queue.Queue()
 
         self._build_ui()
         self._update_custom_color_state()
@@ -242,16 +281,22 @@ class BingoGui(tk.Tk):
         button_row = ttk.Frame(root)
         button_row.grid(row=14, column=0, columnspan=3, sticky="ew", pady=(16, 6))
         button_row.columnconfigure(0, weight=1)
-        generate_btn = ttk.Button(button_row, text=self.tr("generate_pdf"), command=self._generate)
-        generate_btn.grid(row=0, column=0, sticky="e")
+        self.generate_btn = ttk.Button(button_row, text=self.tr("generate_pdf"), command=self._generate)
+        self.generate_btn.grid(row=0, column=0, sticky="e")
+        self.cancel_btn = ttk.Button(button_row, text=self.tr("cancel"), command=self._cancel_generation)
+        self.cancel_btn.grid(row=0, column=1, sticky="e", padx=(8, 0))
+
+        self.progress_bar = ttk.Progressbar(root, variable=self.progress, maximum=1.0, mode="determinate")
+        self.progress_bar.grid(row=15, column=0, columnspan=3, sticky="ew", pady=(4, 0))
 
         status = ttk.Label(root, textvariable=self.status, foreground="#0a4")
-        status.grid(row=15, column=0, columnspan=3, sticky="w", pady=(4, 0))
+        status.grid(row=16, column=0, columnspan=3, sticky="w", pady=(4, 0))
 
         tips = ttk.Label(root, text=self.tr("tip"), wraplength=640, justify="left")
-        tips.grid(row=16, column=0, columnspan=3, sticky="w", pady=(14, 0))
+        tips.grid(row=17, column=0, columnspan=3, sticky="w", pady=(14, 0))
 
         root.columnconfigure(1, weight=1)
+        self._update_busy_state()
 
     def _add_language_selector(self, root: ttk.Frame, row: int) -> None:
         ttk.Label(root, text=self.tr("language")).grid(row=row, column=0, sticky="w", pady=4)
@@ -268,10 +313,12 @@ class BingoGui(tk.Tk):
             if label == selected:
                 self.language_code.set(code)
                 break
-        self.status.set(self.tr("ready"))
+        if not self._busy():
+            self.status.set(self.tr("ready"))
         self._build_ui()
         self._update_custom_color_state()
         self._update_free_center_state()
+        self._update_busy_state()
 
     def _add_entry(
         self,
@@ -399,26 +446,121 @@ class BingoGui(tk.Tk):
             assume_yes=True,
         )
 
+    def _busy(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _update_busy_state(self) -> None:
+        busy = self._busy()
+        self.generate_btn.configure(state="disabled" if busy else "normal")
+        self.cancel_btn.configure(state="normal" if busy and not self._cancel.is_set() else "disabled")
+
     def _generate(self) -> None:
+        if self._busy():
+            return
         try:
             config = self._build_config()
             if not config.output:
                 raise ValueError(self.tr("output_required"))
-
-            self.status.set(self.tr("generating"))
-            self.update_idletasks()
-            generate_pdf(config, warning_handler=self._warning_handler)
+            validate_config(config)
         except ValueError as err:
-            self.status.set(self.tr("ready"))
             messagebox.showerror(self.tr("cannot_generate"), str(err))
             return
+
+        # Dialogs must run on the UI thread, so every warning is confirmed before the worker starts.
+        for warning in collect_warnings(config):
+            if not self._warning_handler(warning):
+                return
+
+        self._cancel.clear()
+        self.progress.set(0.0)
+        self.status.set(self.tr("generating"))
+        self._worker = threading.Thread(target=self._run_generation, args=(config,), daemon=True)
+        self._worker.start()
+        self._update_busy_state()
+        self.after(POLL_INTERVAL_MS, self._poll_worker)
+
+    def _run_generation(self, config: Config) -> None:
+        """Worker thread body; talks to the UI thread only through the event queue."""
+        try:
+            stats = generate_pdf(
+                config,
+                warning_handler=lambda _message: True,
+                progress=lambda update: self._events.put(("progress", update)),
+                cancel=self._cancel,
+            )
+        except GenerationCanceled:
+            self._events.put(("canceled",))
+        except ValueError as err:
+            self._events.put(("error", "cannot_generate", str(err)))
         except Exception as err:  # pragma: no cover
-            self.status.set(self.tr("ready"))
-            messagebox.showerror(self.tr("unexpected_error"), str(err))
+            self._events.put(("error", "unexpected_error", str(err)))
+        else:
+            self._events.put(("done", config.output, stats))
+
+    def _poll_worker(self) -> None:
+        latest_progress = None
+        finished = None
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "progress":
+                latest_progress = event
+            else:
+                finished = event
+
+        if latest_progress is not None:
+            update: Progress = latest_progress[1]
+            self.progress.set(update.pages_done / update.total_pages if update.total_pages else 1.0)
+            if not self._cancel.is_set():
+                minutes, seconds = divmod(round(update.eta), 60)
+                self.status.set(
+                    self.tr(
+                        "generating_pages",
+                        page=str(update.pages_done),
+                        pages=str(update.total_pages),
+                        eta=f"{minutes}:{seconds:02d}",
+                    )
+                )
+        if finished is None:
+            self.after(POLL_INTERVAL_MS, self._poll_worker)
             return
 
-        self.status.set(self.tr("generated", path=config.output))
-        messagebox.showinfo(self.tr("done"), self.tr("generated_message", path=config.output))
+        self._worker = None
+        self._update_busy_state()
+        if finished[0] == "done":
+            self.progress.set(1.0)
+            self.status.set(self.tr("generated", path=finished[1]))
+            message = self.tr("generated_message", path=finished[1]) + "\n\n" + self._timings_text(finished[2])
+            messagebox.showinfo(self.tr("done"), message)
+        elif finished[0] == "canceled":
+            self.progress.set(0.0)
+            self.status.set(self.tr("canceled"))
+        else:
+            self.progress.set(0.0)
+            self.status.set(self.tr("ready"))
+            messagebox.showerror(self.tr(finished[1]), finished[2])
+
+    def _timings_text(self, stats: GenerationStats) -> str:
+        lines = [f"{self.tr('timings')}:"]
+        for phase, seconds in stats.timings.items():
+            lines.append(f"{self.tr('phase_' + phase)}: {seconds:.2f} s")
+        lines.append(f"{self.tr('phase_total')}: {stats.seconds:.2f} s")
+        lines.append(
+            self.tr(
+                "throughput",
+                cards=f"{stats.cards_per_second:,.0f}",
+                pages=f"{stats.pages_per_second:,.0f}",
+            )
+        )
+        return "\n".join(lines)
+
+    def _cancel_generation(self) -> None:
+        if self._busy():
+            self._cancel.set()
+            self.status.set(self.tr("canceling"))
+            self._update_busy_state()
 
 
 def main() -> int:
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Run many generation jobs from one JSON manifest in a single warm process."""
+
+from __future__ import annotations
+
+import functools
+import json
+import sys
+import time
+import typing
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from bingo_generator import Config, collect_warnings, confirm_or_exit, generate_pdf, validate_config
+
+
+@dataclass
+class JobResult:
+    output: str
+    seconds: float
+    cards: int = 0
+    pages: int = 0
+    error: Optional[str] = None
+    # Wall seconds per generation phase, as in GenerationStats.timings.
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+@functools.lru_cache(maxsize=None)
+def _option_types() -> Dict[str, Tuple[type, bool]]:
+    """Map every Config field to (value type, whether None is allowed), read from its annotation."""
+    types: Dict[str, Tuple[type, bool]] = {}
+    for name, hint in typing.get_type_hints(Config).items():
+        args = typing.get_args(hint)
+        if typing.get_origin(hint) is typing.Union:
+            types[name] = (next(arg for arg in args if arg is not type(None)), type(None) in args)
+        else:
+            types[name] = (hint, False)
+    return types
+
+
+def config_from_options(
+    options: Any,
+    defaults: Config,
+    allowed: Optional[Collection[str]] = None,
+) -> Config:
+    """Build a Config from a JSON object keyed by Config field names.
+
+    Hyphenated option names are accepted too. Values must have the type of the
+    Config field they set (null only for optional fields, and a bool is not an
+    int); ``allowed`` restricts which fields may be set.
+    """
+    if not isinstance(options, dict):
+        raise ValueError("expected an object of options")
+    options = {key.replace("-", "_"): value for key, value in options.items()}
+    names = {field.name for field in fields(Config)} if allowed is None else set(allowed)
+    unknown = sorted(set(options) - names)
+    if unknown:
+        raise ValueError(f"unknown option(s) {', '.join(unknown)}")
+    types = _option_types()
+    for key, value in options.items():
+        expected, optional = types[key]
+        if value is None and optional:
+            continue
+        if type(value) is not expected:
+            kind = f"{expected.__name__} or null" if optional else expected.__name__
+            raise ValueError(f"'{key}' must be {kind}, got {value!r}")
+    return replace(defaults, **options)
+
+
+def load_manifest(path: str, defaults: Config) -> List[Config]:
+    """Read a manifest and return one Config per job.
+
+    The manifest is a JSON list of objects (or ``{"jobs": [...]}``) keyed by
+    Config field names; options a job leaves out come from ``defaults``.
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except OSError as err:
+        raise ValueError(f"Cannot read manifest {path}: {err.strerror}") from err
+    except json.JSONDecodeError as err:
+        raise ValueError(f"Manifest {path} is not valid JSON: {err}") from err
+
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list) or not jobs:
+        raise ValueError("Manifest must be a non-empty list of jobs")
+
+    configs: List[Config] = []
+    for number, job in enumerate(jobs, start=1):
+        try:
+            configs.append(config_from_options(job, defaults))
+        except ValueError as err:
+            raise ValueError(f"Job {number}: {err}") from err
+
+    outputs = [config.output for config in configs]
+    duplicates = sorted({output for output in outputs if outputs.count(output) > 1})
+    if duplicates:
+        raise ValueError(f"Several jobs write to the same output: {', '.join(duplicates)}")
+    return configs
+
+
+def run_job(config: Config) -> JobResult:
+    """Generate one job; warnings must already have been confirmed by the caller."""
+    start = time.perf_counter()
+    try:
+        stats = generate_pdf(config, warning_handler=lambda _message: True)
+    except ValueError as err:
+        return JobResult(output=config.output, seconds=time.perf_counter() - start, error=str(err))
+    return JobResult(
+        output=config.output,
+        seconds=time.perf_counter() - start,
+        cards=stats.cards,
+        pages=stats.pages,
+        timings=stats.timings,
+    )
+
+
+def run_manifest(configs: List[Config], parallel: int = 1) -> List[JobResult]:
+    """Run every job and return results in manifest order.
+
+    Sequential runs share this process, so ReportLab and its font metrics are
+    loaded once for all jobs. With ``parallel`` above 1, jobs are spread over
+    that many long-lived worker processes, each loading ReportLab only once.
+    """
+    if parallel <= 1:
+        return [run_job(config) for config in configs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=parallel) as pool:
+        return list(pool.map(run_job, configs))
+
+
+def run_manifest_command(
+    path: str,
+    defaults: Config,
+    parallel: int,
+    validate_only: bool = False,
+    timings: bool = False,
+) -> int:
+    """Run a manifest from the command line; with ``validate_only`` check every job and render nothing."""
+    if parallel <= 0:
+        raise ValueError("--parallel-jobs must be greater than 0")
+    configs = load_manifest(path, defaults)
+    # Check every job and confirm its warnings before anything is rendered, so a
+    # bad job fails the batch early and parallel workers never prompt.
+    for number, config in enumerate(configs, start=1):
+        try:
+            validate_config(config)
+        except ValueError as err:
+            raise ValueError(f"Job {number} ({config.output}): {err}") from err
+        for warning in collect_warnings(config):
+            if validate_only:
+                print(f"WARNING: Job {number} ({config.output}): {warning}")
+            else:
+                confirm_or_exit(f"Job {number} ({config.output}): {warning}", config.assume_yes)
+    if validate_only:
+        print(f"All {len(configs)} job(s) are valid.")
+        return 0
+
+    start = time.perf_counter()
+    results = run_manifest(configs, parallel)
+    total = time.perf_counter() - start
+
+    width = max(len(result.output) for result in results)
+    for result in results:
+        if result.error is not None:
+            print(f"{result.output:<{width}}  FAILED  {result.error}", file=sys.stderr)
+            continue
+        rate = result.cards / result.seconds if result.seconds > 0 else 0.0
+        print(
+            f"{result.output:<{width}}  {result.cards:>8} cards  {result.pages:>7} pages  "
+            f"{result.seconds:8.2f}s  {rate:10,.0f} cards/s"
+        )
+        if timings:
+            print("  " + "  ".join(f"{phase} {seconds:.3f}s" for phase, seconds in result.timings.items()))
+    failed = sum(result.error is not None for result in results)
+    print(f"{len(results) - failed} of {len(results)} job(s) generated in {total:.2f}s.")
+    return 1 if failed else 0
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Bitset cards and winning-pattern masks shared by verification, simulation and uniqueness checks."""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Cell ``row * 5 + col`` is bit ``row * 5 + col`` of a 25-bit mask.
+FULL_MASK = (1 << 25) - 1
+CENTER_MASK = 1 << 12
+ROW_MASKS = tuple(0b11111 << (row * 5) for row in range(5))
+COL_MASKS = tuple(sum(1 << (row * 5 + col) for row in range(5)) for col in range(5))
+DIAGONAL_MASK = sum(1 << (i * 6) for i in range(5))
+ANTI_DIAGONAL_MASK = sum(1 << (i * 4 + 4) for i in range(5))
+CORNERS_MASK = 1 << 0 | 1 << 4 | 1 << 20 | 1 << 24
+X_MASK = DIAGONAL_MASK | ANTI_DIAGONAL_MASK
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A winning pattern: a card has it once every cell of any one of ``masks`` is marked."""
+
+    name: str
+    masks: Tuple[int, ...]
+
+    def matches(self, marked: int) -> bool:
+        for mask in self.masks:
+            if marked & mask == mask:
+                return True
+        return False
+
+    @functools.cached_property
+    def cell_masks(self) -> Tuple[Tuple[int, ...], ...]:
+        """Per cell, the masks through it; marking a cell can only complete one of these."""
+        return tuple(tuple(mask for mask in self.masks if mask >> cell & 1) for cell in range(25))
+
+    def min_marks(self, free_mask: int = 0) -> int:
+        """Fewest called numbers that can complete the pattern when ``free_mask`` starts marked."""
+        return min(bin(mask & ~free_mask).count("1") for mask in self.masks)
+
+
+BUILTIN_PATTERNS: Dict[str, Pattern] = {
+    pattern.name: pattern
+    for pattern in (
+        Pattern("line", ROW_MASKS + COL_MASKS + (DIAGONAL_MASK, ANTI_DIAGONAL_MASK)),
+        Pattern("row", ROW_MASKS),
+        Pattern("column", COL_MASKS),
+        Pattern("diagonal", (DIAGONAL_MASK, ANTI_DIAGONAL_MASK)),
+        Pattern("four-corners", (CORNERS_MASK,)),
+        Pattern("x", (X_MASK,)),
+        Pattern("full-house", (FULL_MASK,)),
+    )
+}
+PATTERN_ALIASES = {"blackout": "full-house", "corners": "four-corners"}
+DEFAULT_PATTERNS = "line,full-house"
+
+
+def grid_mask(grid: str) -> int:
+    """Mask of a 5x5 grid written row by row with ``x`` for cells in the pattern and ``.`` for the rest.
+
+    Rows may be separated by ``/`` or whitespace, for example ``x...x/...../..x../...../x...x``.
+    """
+    cells = re.sub(r"[\s/]", "", grid).lower()
+    if len(cells) != 25 or set(cells) - {"x", "."}:
+        raise ValueError(f"Pattern grid '{grid}' must have 25 cells of 'x' or '.'")
+    mask = sum(1 << cell for cell, mark in enumerate(cells) if mark == "x")
+    if not mask:
+        raise ValueError(f"Pattern grid '{grid}' marks no cells")
+    return mask
+
+
+def parse_pattern(spec: str) -> Pattern:
+    """A built-in pattern name, or a user pattern ``name=grid|grid...`` won by completing any of its grids."""
+    spec = spec.strip()
+    name = PATTERN_ALIASES.get(spec.lower(), spec.lower())
+    if name in BUILTIN_PATTERNS:
+        return BUILTIN_PATTERNS[name]
+    if "=" in spec:
+        name, grids = (part.strip() for part in spec.split("=", 1))
+    else:
+        name, grids = spec, spec
+    if not re.search(r"[x.]{5}", grids.lower()):
+        raise ValueError(f"Unknown pattern '{spec}'; use one of {', '.join(BUILTIN_PATTERNS)} or a 5x5 grid")
+    return Pattern(name, tuple(grid_mask(grid) for grid in grids.split("|")))
+
+
+def parse_patterns(specs: str) -> List[Pattern]:
+    """Comma-separated patterns for command-line options, in the given order."""
+    patterns = [parse_pattern(spec) for spec in specs.split(",") if spec.strip()]
+    if not patterns:
+        raise ValueError("At least one pattern is required")
+    names = [pattern.name for pattern in patterns]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Pattern(s) listed more than once: {', '.join(duplicates)}")
+    return patterns
+
+
+class BitCard:
+    """One card as bitsets: a 25-bit mask of marked cells and a mask of the numbers it holds.
+
+    Cells hold number offsets as in CardBatch (``FREE_CELL``, 0, for the free
+    center, which starts marked). Checking a pattern is an AND and a compare
+    per mask, and two cards' shared numbers are a popcount of ``numbers``.
+    """
+
+    __slots__ = ("cells", "marked", "numbers", "_positions")
+
+    def __init__(self, cells: Sequence[int]) -> None:
+        self.cells = tuple(cells)
+        self.marked = 0
+        self.numbers = 0
+        self._positions: Dict[int, int] = {}
+        for cell, offset in enumerate(self.cells):
+            if offset:
+                self.numbers |= 1 << offset
+                self._positions[offset] = cell
+            else:
+                self.marked |= 1 << cell
+
+    def mark(self, offset: int) -> int:
+        """Mark the cell holding number ``offset`` and return it, or -1 if the card lacks that number."""
+        cell = self._positions.get(offset, -1)
+        if cell >= 0:
+            self.marked |= 1 << cell
+        return cell
+
+    def has(self, pattern: Pattern) -> bool:
+        return pattern.matches(self.marked)
+
+    def completed(self, patterns: Iterable[Pattern]) -> List[str]:
+        return [pattern.name for pattern in patterns if pattern.matches(self.marked)]
+
+    def shared(self, other: BitCard) -> int:
+        """How many numbers this card and ``other`` have in common."""
+        return bin(self.numbers & other.numbers).count("1")
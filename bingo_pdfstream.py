@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Minimal PDF writer that flushes every page to disk as soon as it is added."""
+
+from __future__ import annotations
+
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Optional, Sequence, Tuple
+
+# Leaf /Pages nodes hold at most this many pages to keep the page tree shallow and balanced.
+PAGES_PER_NODE = 64
+# Cross-reference entries formatted per write, so closing a huge file stays cheap.
+XREF_CHUNK = 4096
+
+_ESCAPES = {ord("\\"): "\\\\", ord("("): "\\(", ord(")"): "\\)"}
+
+
+def pdf_string(text: str) -> bytes:
+    """Encode ``text`` as a literal PDF string for a WinAnsi-encoded standard font."""
+    return b"(" + text.translate(_ESCAPES).encode("cp1252", errors="replace") + b")"
+
+
+def pdf_number(value: float) -> str:
+    """Format a coordinate compactly, the way PDF producers usually do."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text in {"-0", ""} else text
+
+
+class StreamingPdfWriter:
+    """Write a PDF incrementally with memory bounded by the page count, not page content.
+
+    Pages are serialized and written the moment they are added. Only object
+    offsets and page ids are kept (a few bytes per page) so the cross-reference
+    table and page tree can be written when the writer is closed. All pages
+    share one resource dictionary holding every font and form.
+    """
+
+    def __init__(self, path: str, page_size: Tuple[float, float], compress: bool = True) -> None:
+        self._handle: BinaryIO = open(path, "wb")
+        self._page_size = page_size
+        self._compress = compress
+        self._offsets = array("q", [0])
+        self._page_ids = array("q")
+        self._leaf_ids = array("q")
+        self._fonts: Dict[str, int] = {}
+        self._forms: Dict[str, int] = {}
+        self._position = 0
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._catalog_id = self._reserve()
+        self._root_id = self._reserve()
+        self._resources_id = self._reserve()
+
+    def _write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self._position += len(data)
+
+    def _reserve(self) -> int:
+        self._offsets.append(0)
+        return len(self._offsets) - 1
+
+    def _write_object(self, obj_id: int, body: bytes) -> None:
+        self._offsets[obj_id] = self._position
+        self._write(b"%d 0 obj\n" % obj_id + body + b"\nendobj\n")
+
+    def _write_stream(self, obj_id: int, content: bytes, extra: str = "") -> None:
+        if self._compress:
+            content = zlib.compress(content)
+            extra += " /Filter /FlateDecode"
+        header = f"<< /Length {len(content)}{extra} >>\nstream\n".encode("ascii")
+        self._write_object(obj_id, header + content + b"\nendstream")
+
+    def add_standard_font(self, base_font: str) -> str:
+        """Register one of the 14 standard Type 1 fonts and return its resource name."""
+        name = f"F{len(self._fonts) + 1}"
+        obj_id = self._reserve()
+        self._write_object(
+            obj_id,
+            (
+                f"<< /Type /Font /Subtype /Type1 /Name /{name} /BaseFont /{base_font} "
+                "/Encoding /WinAnsiEncoding >>"
+            ).encode("ascii"),
+        )
+        self._fonts[name] = obj_id
+        return name
+
+    def add_form(self, content: bytes, bbox: Sequence[float]) -> str:
+        """Write a form XObject drawn with the fonts registered so far and return its name."""
+        name = f"Fm{len(self._forms) + 1}"
+        obj_id = self._reserve()
+        box = " ".join(pdf_number(value) for value in bbox)
+        fonts = " ".join(f"/{font} {font_id} 0 R" for font, font_id in self._fonts.items())
+        self._write_stream(
+            obj_id,
+            content,
+            f" /Type /XObject /Subtype /Form /FormType 1 /BBox [{box}] /Resources << /Font << {fonts} >> >>",
+        )
+        self._forms[name] = obj_id
+        return name
+
+    def add_page(self, content: bytes) -> None:
+        if len(self._page_ids) % PAGES_PER_NODE == 0:
+            self._leaf_ids.append(self._reserve())
+        parent_id = self._leaf_ids[-1]
+        content_id = self._reserve()
+        self._write_stream(content_id, content)
+        page_id = self._reserve()
+        width, height = self._page_size
+        self._write_object(
+            page_id,
+            (
+                f"<< /Type /Page /Parent {parent_id} 0 R /MediaBox [0 0 {pdf_number(width)} {pdf_number(height)}] "
+                f"/Resources {self._resources_id} 0 R /Contents {content_id} 0 R >>"
+            ).encode("ascii"),
+        )
+        self._page_ids.append(page_id)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_ids)
+
+    def close(self, producer: Optional[str] = None) -> None:
+        page_ids = self._page_ids
+        for leaf_index, leaf_id in enumerate(self._leaf_ids):
+            kids_ids = page_ids[leaf_index * PAGES_PER_NODE : (leaf_index + 1) * PAGES_PER_NODE]
+            kids = " ".join(f"{page_id} 0 R" for page_id in kids_ids)
+            self._write_object(
+                leaf_id,
+                f"<< /Type /Pages /Parent {self._root_id} 0 R /Kids [{kids}] /Count {len(kids_ids)} >>".encode("ascii"),
+            )
+        kids = " ".join(f"{leaf_id} 0 R" for leaf_id in self._leaf_ids)
+        self._write_object(
+            self._root_id,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("ascii"),
+        )
+
+        fonts = " ".join(f"/{name} {obj_id} 0 R" for name, obj_id in self._fonts.items())
+        forms = " ".join(f"/{name} {obj_id} 0 R" for name, obj_id in self._forms.items())
+        self._write_object(
+            self._resources_id,
+            f"<< /ProcSet [/PDF /Text] /Font << {fonts} >> /XObject << {forms} >> >>".encode("ascii"),
+        )
+        self._write_object(self._catalog_id, f"<< /Type /Catalog /Pages {self._root_id} 0 R >>".encode("ascii"))
+        info_id = self._reserve()
+        self._write_object(info_id, b"<< /Producer " + pdf_string(producer or "bingo_generator") + b" >>")
+
+        xref_offset = self._position
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % len(self._offsets))
+        for start in range(1, len(self._offsets), XREF_CHUNK):
+            chunk = self._offsets[start : start + XREF_CHUNK]
+            self._write(b"".join(b"%010d 00000 n \n" % offset for offset in chunk))
+        self._write(
+            (
+                f"trailer\n<< /Size {len(self._offsets)} /Root {self._catalog_id} 0 R /Info {info_id} 0 R >>\n"
+                f"startxref\n{xref_offset}\n%%EOF\n"
+            ).encode("ascii")
+        )
+        self._handle.close()
+
+    def abort(self) -> None:
+        self._handle.close()
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Local HTTP service that generates bingo PDFs in a pool of warm worker processes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Sequence, Tuple
+
+import bingo_generator
+from bingo_generator import (
+    Config,
+    GenerationStats,
+    build_parser,
+    collect_warnings,
+    config_from_args,
+    serial_index_path,
+    validate_config,
+)
+from bingo_manifest import config_from_options
+
+DEFAULT_PORT = 8765
+# Largest accepted request body; a config is a few hundred bytes.
+MAX_BODY_BYTES = 64 * 1024
+# Output paths, formats, splitting, resuming, archives and process counts stay server-side.
+SERVER_OPTIONS = {"output", "archive", "workers", "format", "max_pages_per_file", "resume"}
+REQUEST_OPTIONS = tuple(field.name for field in fields(Config) if field.name not in SERVER_OPTIONS)
+
+
+def _warm_worker() -> None:
+    """Load ReportLab and its Helvetica metrics once per worker, before the first request."""
+    bingo_generator._require_reportlab()
+    bingo_generator.stringWidth("0", "Helvetica", 10)
+    bingo_generator.stringWidth("0", "Helvetica-Bold", 10)
+
+
+def _render(config: Config) -> GenerationStats:
+    return bingo_generator.generate_pdf(config, warning_handler=lambda _message: True)
+
+
+class BingoService:
+    """Validates requests and renders them in a bounded pool of warm processes."""
+
+    def __init__(self, workers: int, max_pending: int, max_sheets: int, work_dir: str) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_sheets = max_sheets
+        self.work_dir = work_dir
+        self.defaults = config_from_args(build_parser().parse_args([]))
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._served = 0
+
+    def warm_up(self) -> None:
+        """Start every worker now rather than on the first request."""
+        for future in [self.pool.submit(_warm_worker) for _ in range(self.workers)]:
+            future.result()
+
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": "ok",
+                "workers": self.workers,
+                "busy": self._busy,
+                "max_pending": self.max_pending,
+                "served": self._served,
+            }
+
+    def parse(self, payload: Any) -> Config:
+        config = config_from_options(payload, self.defaults, allowed=REQUEST_OPTIONS)
+        validate_config(config)
+        if config.sheets > self.max_sheets:
+            raise ValueError(f"At most {self.max_sheets} sheets can be requested at once")
+        if (config.unique or config.max_shared is not None) and config.first_card - 1 + config.sheets > self.max_sheets:
+            # Unique and --max-shared runs replay every card before first_card to screen the new ones.
+            raise ValueError(f"Unique and max_shared requests must end at or before card {self.max_sheets}")
+        warnings = collect_warnings(config)
+        if warnings and not config.assume_yes:
+            raise ValueError(" ".join(warnings) + " Set assume_yes to generate anyway.")
+        return config
+
+    def try_acquire(self) -> bool:
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._lock:
+            self._busy += 1
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._busy -= 1
+            self._served += 1
+        self._slots.release()
+
+    def generate(self, config: Config) -> Tuple[str, GenerationStats]:
+        handle, path = tempfile.mkstemp(suffix=".pdf", dir=self.work_dir)
+        os.close(handle)
+        config.output = path
+        try:
+            return path, self.pool.submit(_render, config).result()
+        except BaseException:
+            os.remove(path)
+            raise
+        finally:
+            # Only the PDF is returned; a serial index written beside it is not kept.
+            index_path = serial_index_path(path)
+            if os.path.exists(index_path):
+                os.remove(index_path)
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+
+class BingoRequestHandler(BaseHTTPRequestHandler):
+    server_version = "BingoServe/1"
+    service: BingoService
+
+    def _send_json(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, self.service.health())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        if self.path != "/generate":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if not 0 < length <= MAX_BODY_BYTES:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Send a JSON config of at most {MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            config = self.service.parse(json.loads(self.rfile.read(length)))
+        except json.JSONDecodeError as err:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {err}"})
+            return
+        except ValueError as err:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(err)})
+            return
+
+        if not self.service.try_acquire():
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Too many requests in progress"})
+            return
+        try:
+            path, stats = self.service.generate(config)
+        except ValueError as err:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(err)})
+            return
+        except Exception as err:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(err)})
+            return
+        finally:
+            self.service.release()
+
+        try:
+            with open(path, "rb") as handle:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "application/pdf")
+                self.send_header("Content-Length", str(os.fstat(handle.fileno()).st_size))
+                self.send_header("X-Bingo-Seed", str(stats.seed))
+                self.send_header("X-Bingo-Cards", str(stats.cards))
+                self.end_headers()
+                shutil.copyfileobj(handle, self.wfile)
+        finally:
+            os.remove(path)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Serve bingo PDF generation over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Warm worker processes rendering PDFs (default: CPU count, at most 4)",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        help="Requests rendering or queued at once before answering 503 (default: 2 x workers)",
+    )
+    parser.add_argument(
+        "--max-sheets",
+        type=int,
+        default=10000,
+        help="Largest sheet count a single request may ask for (default: 10000)",
+    )
+    args = parser.parse_args(argv)
+    max_pending = args.max_pending if args.max_pending is not None else 2 * args.workers
+    if args.workers <= 0 or max_pending <= 0 or args.max_sheets <= 0:
+        print("Error: --workers, --max-pending and --max-sheets must be greater than 0", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="bingo-serve-") as work_dir:
+        service = BingoService(args.workers, max_pending, args.max_sheets, work_dir)
+        try:
+            service.warm_up()
+            BingoRequestHandler.service = service
+            server = ThreadingHTTPServer((args.host, args.port), BingoRequestHandler)
+        except (OSError, ValueError) as err:
+            service.close()
+            print(f"Error: {err}", file=sys.stderr)
+            return 2
+        print(
+            f"Serving on http://{args.host}:{server.server_port} "
+            f"({args.workers} worker(s), POST /generate, GET /health)",
+            file=sys.stderr,
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("Stopping.", file=sys.stderr)
+        finally:
+            server.server_close()
+            service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Monte Carlo simulation of bingo games over a card set."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import bingo_generator
+from bingo_generator import (
+    CardBatch,
+    Config,
+    add_card_options,
+    card_config_from_args,
+    collect_cards,
+    load_archive,
+    load_numpy,
+)
+from bingo_patterns import DEFAULT_PATTERNS, Pattern, parse_patterns
+
+np = load_numpy()
+
+# Games played per task; fixed so results for a --game-seed do not depend on --workers.
+GAMES_PER_CHUNK = 2000
+# Most per-cell call times held at once while evaluating games with NumPy.
+EVAL_BUDGET = 8_000_000
+
+
+@dataclass
+class PatternStats:
+    pattern: str
+    # first_win[k]: games whose first card with this pattern completed it on call k.
+    first_win: List[int]
+    # winners[k]: games in which k cards completed the pattern on that same call.
+    winners: Dict[int, int] = field(default_factory=dict)
+
+    def merge(self, other: PatternStats) -> None:
+        self.first_win = [a + b for a, b in zip(self.first_win, other.first_win)]
+        for count, games in other.winners.items():
+            self.winners[count] = self.winners.get(count, 0) + games
+
+    @property
+    def games(self) -> int:
+        return sum(self.first_win)
+
+    def percentile(self, fraction: float) -> int:
+        """Smallest call count by which at least ``fraction`` of games had a winner."""
+        target = fraction * self.games
+        seen = 0
+        for calls, games in enumerate(self.first_win):
+            seen += games
+            if games and seen >= target:
+                return calls
+        return len(self.first_win) - 1
+
+    def mean_calls(self) -> float:
+        return sum(calls * games for calls, games in enumerate(self.first_win)) / self.games if self.games else 0.0
+
+    def mean_winners(self) -> float:
+        return sum(count * games for count, games in self.winners.items()) / self.games if self.games else 0.0
+
+
+def _mask_cells(mask: int) -> List[int]:
+    return [cell for cell in range(25) if mask >> cell & 1]
+
+
+def _play_numpy(
+    cells: "np.ndarray",
+    span: int,
+    patterns: Sequence[Pattern],
+    seed: int,
+    chunk: int,
+    games: int,
+) -> Dict[str, PatternStats]:
+    """Play ``games`` games by computing, per card, the call on which each pattern mask completes.
+
+    A mask is complete on the latest call among its cells, so one random call
+    order answers every pattern for every card without stepping call by call.
+    """
+    rng = np.random.default_rng([seed, chunk])
+    dtype = np.uint8 if span < 0xFF else np.uint16 if span < 0xFFFF else np.uint32
+    call_numbers = np.arange(1, span + 1, dtype=dtype)
+    stats = {pattern.name: PatternStats(pattern.name, [0] * (span + 1)) for pattern in patterns}
+    groups = {pattern.name: [np.array(_mask_cells(mask)) for mask in pattern.masks] for pattern in patterns}
+    step = max(1, EVAL_BUDGET // (len(cells) * 25))
+    for start in range(0, games, step):
+        count = min(step, games - start)
+        order = rng.permuted(np.tile(call_numbers, (count, 1)), axis=1)
+        # ranks[g, offset] is the call on which that number comes up; offset 0, the free center, is never waited for.
+        ranks = np.zeros((count, span + 1), dtype=dtype)
+        np.put_along_axis(ranks, order.astype(np.intp), np.broadcast_to(call_numbers, (count, span)), axis=1)
+        times = ranks[:, cells]
+        for pattern, indices in groups.items():
+            done = None
+            for idx in indices:
+                complete = times[:, :, idx].max(axis=2)
+                done = complete if done is None else np.minimum(done, complete)
+            first = done.min(axis=1)
+            winners = (done == first[:, None]).sum(axis=1)
+            result = stats[pattern]
+            result.first_win = (np.array(result.first_win) + np.bincount(first, minlength=span + 1)).tolist()
+            for ties, games_tied in zip(*np.unique(winners, return_counts=True)):
+                result.winners[int(ties)] = result.winners.get(int(ties), 0) + int(games_tied)
+    return stats
+
+
+def _play_python(
+    cards: List[List[int]],
+    span: int,
+    patterns: Sequence[Pattern],
+    seed: int,
+    chunk: int,
+    games: int,
+) -> Dict[str, PatternStats]:
+    rng = random.Random(f"bingo-simulate:{seed}:{chunk}")
+    numbers = list(range(1, span + 1))
+    stats = {pattern.name: PatternStats(pattern.name, [0] * (span + 1)) for pattern in patterns}
+    groups = {pattern.name: [_mask_cells(mask) for mask in pattern.masks] for pattern in patterns}
+    for _ in range(games):
+        rng.shuffle(numbers)
+        ranks = [0] * (span + 1)
+        for call, offset in enumerate(numbers, start=1):
+            ranks[offset] = call
+        best = {name: (span + 1, 0) for name in groups}
+        for card in cards:
+            times = [ranks[offset] for offset in card]
+            for pattern, indices in groups.items():
+                done = min(max(times[cell] for cell in idx) for idx in indices)
+                first, ties = best[pattern]
+                if done < first:
+                    best[pattern] = (done, 1)
+                elif done == first:
+                    best[pattern] = (first, ties + 1)
+        for pattern, (first, ties) in best.items():
+            stats[pattern].first_win[first] += 1
+            stats[pattern].winners[ties] = stats[pattern].winners.get(ties, 0) + 1
+    return stats
+
+
+def _play_chunk(
+    batch: CardBatch,
+    span: int,
+    patterns: Sequence[Pattern],
+    seed: int,
+    chunk: int,
+    games: int,
+) -> Dict[str, PatternStats]:
+    if np is not None:
+        cells = np.asarray(batch.cells).reshape(len(batch), 25)
+        return _play_numpy(cells, span, patterns, seed, chunk, games)
+    cards = [batch.card_offsets(index) for index in range(len(batch))]
+    return _play_python(cards, span, patterns, seed, chunk, games)
+
+
+def simulate(
+    batch: CardBatch,
+    max_number: int,
+    games: int,
+    seed: int,
+    workers: Optional[int] = None,
+    patterns: Optional[Sequence[Pattern]] = None,
+) -> Dict[str, PatternStats]:
+    """Play ``games`` random call orders of the whole number range against every card of ``batch``.
+
+    Games are played in fixed-size chunks, each with its own random stream, so
+    the result for a seed is the same for any ``workers`` count.
+    """
+    span = max_number - batch.min_number + 1
+    patterns = list(patterns) if patterns is not None else parse_patterns(DEFAULT_PATTERNS)
+    chunks = [
+        (chunk, min(GAMES_PER_CHUNK, games - start)) for chunk, start in enumerate(range(0, games, GAMES_PER_CHUNK))
+    ]
+    totals = {pattern.name: PatternStats(pattern.name, [0] * (span + 1)) for pattern in patterns}
+
+    def add(result: Dict[str, PatternStats], _games: int) -> None:
+        for pattern, stats in result.items():
+            totals[pattern].merge(stats)
+
+    if workers is None or workers == 1:
+        for chunk, count in chunks:
+            add(_play_chunk(batch, span, patterns, seed, chunk, count), count)
+    else:
+        tasks = (((batch, span, patterns, seed, chunk, count), count) for chunk, count in chunks)
+        bingo_generator._run_in_pool(workers, _play_chunk, tasks, add)
+    return totals
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Simulate bingo games on a card set and report how many calls it takes until the first "
+            "winner. Pass --cards with a card archive, or the card options (and --sheets) to generate the set."
+        )
+    )
+    add_card_options(parser)
+    parser.add_argument(
+        "--cards",
+        help="Load cards from an archive written with --archive instead of generating them",
+    )
+    parser.add_argument("--games", type=int, default=10000, help="Games to simulate (default: 10000)")
+    parser.add_argument("--game-seed", type=int, help="Seed for the random call orders, for repeatable results")
+    parser.add_argument("--report", help="Also write the full statistics as JSON to this file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Play games in N processes; results for a --game-seed are the same for every N",
+    )
+    parser.add_argument(
+        "--patterns",
+        default=DEFAULT_PATTERNS,
+        help=f"Comma-separated winning patterns, as for bingo_verify.py (default: {DEFAULT_PATTERNS})",
+    )
+    args = parser.parse_args(argv)
+    try:
+        patterns = parse_patterns(args.patterns)
+        if args.games <= 0:
+            raise ValueError("--games must be greater than 0")
+        if args.workers is not None and args.workers <= 0:
+            raise ValueError("--workers must be greater than 0")
+        if args.cards:
+            header, batch = load_archive(args.cards)
+            max_number = header.max_number
+        else:
+            config: Config = card_config_from_args(args)
+            if config.seed is None:
+                config.seed = random.SystemRandom().getrandbits(63)
+                print(f"Card seed: {config.seed}", file=sys.stderr)
+            batch = collect_cards(config)
+            max_number = config.max_number
+    except ValueError as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 2
+
+    game_seed = args.game_seed if args.game_seed is not None else random.SystemRandom().getrandbits(63)
+    start = time.perf_counter()
+    results = simulate(batch, max_number, args.games, game_seed, args.workers, patterns)
+    seconds = time.perf_counter() - start
+
+    rate = args.games / seconds if seconds > 0 else 0.0
+    print(
+        f"Simulated {args.games} game(s) on {len(batch)} card(s), numbers {batch.min_number}-{max_number}, "
+        f"in {seconds:.2f}s ({rate:,.0f} games/s, game seed {game_seed})"
+    )
+    for stats in results.values():
+        single = stats.winners.get(1, 0) / stats.games
+        print(f"{stats.pattern}:")
+        print(
+            f"  calls to first win: min {stats.percentile(0.0)}  p5 {stats.percentile(0.05)}  "
+            f"p25 {stats.percentile(0.25)}  median {stats.percentile(0.5)}  p75 {stats.percentile(0.75)}  "
+            f"p95 {stats.percentile(0.95)}  max {stats.percentile(1.0)}  mean {stats.mean_calls():.2f}"
+        )
+        print(
+            f"  simultaneous winners: mean {stats.mean_winners():.2f}  single winner {single * 100:.1f}%  "
+            f"max {max(stats.winners)}"
+        )
+
+    if args.report:
+        report = {
+            "games": args.games,
+            "cards": len(batch),
+            "min_number": batch.min_number,
+            "max_number": max_number,
+            "game_seed": game_seed,
+            "seconds": seconds,
+            "patterns": {
+                stats.pattern: {
+                    "mean_calls": stats.mean_calls(),
+                    "median_calls": stats.percentile(0.5),
+                    "mean_winners": stats.mean_winners(),
+                    "first_win_histogram": stats.first_win,
+                    "winners_histogram": {str(count): stats.winners[count] for count in sorted(stats.winners)},
+                }
+                for stats in results.values()
+            },
+        }
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
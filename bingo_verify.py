@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Tero Halla-aho
+"""Winning-card verification for a generated bingo card set."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from bingo_generator import (
+    CardBatch,
+    Config,
+    add_card_options,
+    card_config_from_args,
+    collect_cards,
+    load_archive,
+    load_numpy,
+    parse_serial,
+)
+from bingo_patterns import CENTER_MASK, DEFAULT_PATTERNS, BitCard, Pattern, parse_patterns
+
+np = load_numpy()
+
+
+@dataclass
+class CallResult:
+    number: int
+    new_winners: Dict[str, List[int]] = field(default_factory=dict)
+
+
+class WinVerifier:
+    """Incrementally tracks which cards of a set have won as numbers are called.
+
+    An inverted index maps every number to the (card, cell) positions holding
+    it, and each card keeps a 25-bit mask of marked cells. A call only touches
+    the cards containing the called number, and only the pattern masks through
+    the marked cell are tested.
+    """
+
+    def __init__(self, batch: CardBatch, max_number: int, patterns: Optional[Sequence[Pattern]] = None) -> None:
+        self.count = len(batch)
+        self.min_number = batch.min_number
+        self.max_number = max_number
+        self.patterns = list(patterns) if patterns is not None else parse_patterns(DEFAULT_PATTERNS)
+        self.called: List[int] = []
+        self._called_set: set = set()
+        span = max_number - batch.min_number + 1
+
+        if np is not None and isinstance(batch.cells, np.ndarray):
+            flat = batch.cells.reshape(self.count, 25)
+            # Postings are grouped by (number, cell) so each run shares its pattern masks.
+            keys = (flat.astype(np.int64) * 25 + np.arange(25)).ravel()
+            order = np.argsort(keys, kind="stable")
+            counts = np.bincount(keys, minlength=(span + 1) * 25)
+            self._starts = np.concatenate(([0], np.cumsum(counts))).tolist()
+            self._positions = (order // 25).astype(np.uint32)
+            free = (flat == 0).astype(np.uint32) << np.arange(25, dtype=np.uint32)
+            self._marks = free.sum(axis=1, dtype=np.uint32)
+            self._won = {pattern.name: np.zeros(self.count, dtype=bool) for pattern in self.patterns}
+            has_free = bool(self._marks.any())
+        else:
+            postings: List[array] = [array("I") for _ in range(span + 1)]
+            marks = array("I", [0]) * self.count
+            for card in range(self.count):
+                for cell, offset in enumerate(batch.card_offsets(card)):
+                    if offset == 0:
+                        marks[card] |= 1 << cell
+                    else:
+                        postings[offset].append(card * 25 + cell)
+            self._postings = postings
+            self._marks = marks
+            self._won = {pattern.name: bytearray(self.count) for pattern in self.patterns}
+            has_free = any(marks)
+        self._batch = batch
+        # No card can complete a pattern before this many numbers are called.
+        free_mask = CENTER_MASK if has_free else 0
+        self._min_calls = {pattern.name: pattern.min_marks(free_mask) for pattern in self.patterns}
+
+    def call(self, number: int) -> CallResult:
+        if not self.min_number <= number <= self.max_number:
+            raise ValueError(f"Number {number} is outside the range {self.min_number}-{self.max_number}")
+        result = CallResult(number=number, new_winners={pattern.name: [] for pattern in self.patterns})
+        if number in self._called_set:
+            return result
+        self._called_set.add(number)
+        self.called.append(number)
+        offset = number - self.min_number + 1
+        patterns = [pattern for pattern in self.patterns if len(self.called) >= self._min_calls[pattern.name]]
+
+        if np is not None and isinstance(self._marks, np.ndarray):
+            fresh_by_pattern: Dict[str, List["np.ndarray"]] = {pattern.name: [] for pattern in self.patterns}
+            for cell in range(25):
+                start = self._starts[offset * 25 + cell]
+                stop = self._starts[offset * 25 + cell + 1]
+                if start == stop:
+                    continue
+                cards = self._positions[start:stop]
+                # Every card holds a number at most once, so fancy-index updates are safe.
+                marks = self._marks[cards] | np.uint32(1 << cell)
+                self._marks[cards] = marks
+                for pattern in patterns:
+                    masks = pattern.cell_masks[cell]
+                    if not masks:
+                        continue
+                    hit = np.zeros(len(cards), dtype=bool)
+                    for mask in masks:
+                        hit |= (marks & np.uint32(mask)) == mask
+                    won = self._won[pattern.name]
+                    fresh = cards[hit & ~won[cards]]
+                    won[fresh] = True
+                    fresh_by_pattern[pattern.name].append(fresh)
+            for name, parts in fresh_by_pattern.items():
+                if parts:
+                    result.new_winners[name] = np.sort(np.concatenate(parts)).tolist()
+            return result
+
+        marks = self._marks
+        for position in self._postings[offset]:
+            card, cell = divmod(position, 25)
+            mask = marks[card] | (1 << cell)
+            marks[card] = mask
+            for pattern in patterns:
+                won = self._won[pattern.name]
+                if not won[card] and any(mask & line == line for line in pattern.cell_masks[cell]):
+                    won[card] = 1
+                    result.new_winners[pattern.name].append(card)
+        return result
+
+    def card(self, card: int) -> BitCard:
+        """Card position ``card`` as a BitCard carrying its current marks."""
+        if not 0 <= card < self.count:
+            raise ValueError(f"Card {card} is not part of this set")
+        bits = BitCard(self._batch.card_offsets(card))
+        bits.marked = int(self._marks[card])
+        return bits
+
+    def check(self, card: int) -> List[str]:
+        """Return the patterns card position ``card`` has completed so far."""
+        return self.card(card).completed(self.patterns)
+
+    def winners(self, pattern: str) -> List[int]:
+        won = self._won[pattern]
+        if np is not None and isinstance(won, np.ndarray):
+            return np.flatnonzero(won).tolist()
+        return [card for card, flag in enumerate(won) if flag]
+
+
+def _format_cards(cards: Sequence[int], first_card: int) -> str:
+    return ", ".join(f"#{card + first_card}" for card in cards)
+
+
+def _print_call(result: CallResult, first_card: int) -> None:
+    print(f"Called {result.number}.")
+    for pattern, fresh in result.new_winners.items():
+        if fresh:
+            print(f"  New {pattern} winner(s): {_format_cards(fresh, first_card)}")
+
+
+def _card_number(text: str, serial_prefix: Optional[str]) -> int:
+    """Card number of a 'check' argument: a plain card number or a printed serial."""
+    if text.isdigit():
+        return int(text)
+    prefix, card_number = parse_serial(text)
+    if serial_prefix is not None and prefix != serial_prefix:
+        raise ValueError(f"Serial {text} is not from this event (prefix '{serial_prefix}')")
+    return card_number
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check bingo winners against called numbers. Pass --cards with a card "
+            "archive, or the same card options the cards were generated with (at least --seed)."
+        )
+    )
+    add_card_options(parser)
+    parser.add_argument(
+        "--calls",
+        help="Comma-separated called numbers to replay; without it numbers are read from stdin",
+    )
+    parser.add_argument(
+        "--cards",
+        help="Load cards from an archive written with --archive instead of regenerating them",
+    )
+    parser.add_argument(
+        "--patterns",
+        default=DEFAULT_PATTERNS,
+        help=(
+            "Comma-separated winning patterns to track: line, row, column, diagonal, four-corners, x, "
+            "full-house (or blackout), or a 5x5 grid such as 'plus=..x../..x../xxxxx/..x../..x..' "
+            f"(default: {DEFAULT_PATTERNS})"
+        ),
+    )
+    try:
+        args = parser.parse_args(argv)
+        patterns = parse_patterns(args.patterns)
+        if args.cards:
+            header, batch = load_archive(args.cards)
+            verifier = WinVerifier(batch, header.max_number, patterns)
+            first_card = header.first_card
+            serial_prefix = args.serial_prefix
+        else:
+            config: Config = card_config_from_args(args)
+            verifier = WinVerifier(collect_cards(config), config.max_number, patterns)
+            first_card = config.first_card
+            serial_prefix = config.serial_prefix
+    except ValueError as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 2
+
+    if args.calls:
+        try:
+            for raw in args.calls.split(","):
+                verifier.call(int(raw))
+        except ValueError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            return 2
+        print(f"Called {len(verifier.called)} number(s).")
+        for pattern in patterns:
+            print(f"{pattern.name}: {_format_cards(verifier.winners(pattern.name), first_card) or 'none'}")
+        return 0
+
+    print(f"Loaded {verifier.count} card(s). Enter a called number, 'check <card or serial>', or 'quit'.")
+    for line in sys.stdin:
+        command = line.strip().lower()
+        if not command:
+            continue
+        if command in {"q", "quit", "exit"}:
+            break
+        try:
+            if command.startswith("check"):
+                card_number = _card_number(line.split()[1], serial_prefix)
+                won = verifier.check(card_number - first_card)
+                print(f"Card #{card_number}: {', '.join(won) if won else 'no win'}")
+            else:
+                _print_call(verifier.call(int(command)), first_card)
+        except (ValueError, IndexError) as err:
+            print(f"Error: {err or 'invalid command'}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))